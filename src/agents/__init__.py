@@ -5,10 +5,16 @@ Phase 1: Single BuilderAgent (Generator Tier 3)
 Phase 2: Multi-agent swarm (Planner, Builder, Tester, Critic, Reflexion)
 """
 
-from src.agents.builder import BuilderAgent, AgentOrchestrator, BuildResult
-
 __all__ = [
     "BuilderAgent",
     "AgentOrchestrator", 
     "BuildResult"
 ]
+
+
+def __getattr__(name):
+    # Defer importing the builder (and its governance/toolbus graph) until used
+    if name in __all__:
+        from src.agents import builder
+        return getattr(builder, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,47 @@
+"""
+Shared entry point for quickstart.py and the example scripts
+
+Keeps the load-policy → create-agent → build sequence in one importable
+module so each script is a thin `if __name__ == "__main__"` dispatch.
+"""
+
+from pathlib import Path
+from src.interfaces import Policy
+from src.governance.policy import PolicyLoader
+from src.agents.builder import BuilderAgent, BuildResult
+from src.model_provider import ModelProvider
+
+
+DEFAULT_POLICY_PATH = Path(".aureus/policy.yaml")
+
+
+def load_policy(policy_path: Path = DEFAULT_POLICY_PATH) -> Policy:
+    """Load the governance policy used by the example scripts"""
+    return PolicyLoader().load(policy_path)
+
+
+def create_agent(
+    provider: ModelProvider,
+    policy_path: Path = DEFAULT_POLICY_PATH
+) -> BuilderAgent:
+    """Create a BuilderAgent for the given provider and policy file"""
+    return BuilderAgent(policy=load_policy(policy_path), model_provider=provider)
+
+
+def run_build(
+    intent: str,
+    provider: ModelProvider,
+    policy_path: Path = DEFAULT_POLICY_PATH
+) -> BuildResult:
+    """
+    Run a single build from natural language intent
+    
+    Args:
+        intent: Natural language intent
+        provider: Model provider to generate code with
+        policy_path: Path to policy YAML file
+    
+    Returns:
+        BuildResult from the agent
+    """
+    return create_agent(provider, policy_path).build(intent)
@@ -13,7 +13,7 @@ from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
-import uuid
+import secrets
 
 from src.agents.builder import BuilderAgent, BuildResult
 from src.interfaces import Policy
@@ -22,6 +22,12 @@ from src.memory.cost_ledger import CostLedger, CostEntry
 from src.memory.summarization import PatternExtractor
 
 
+# Intent keywords for rule-based decomposition
+_API_WORDS = ("api", "endpoint", "route")
+_AUTH_WORDS = ("auth", "login", "register")
+_DB_WORDS = ("database", "db", "storage")
+
+
 class TaskStatus(Enum):
     """Status of a subtask"""
     PENDING = "pending"
@@ -31,7 +37,7 @@ class TaskStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class SubTask:
     """A decomposed subtask"""
     id: str
@@ -75,14 +81,15 @@ class PlanDecomposer:
         
         subtasks = []
         
-        # Common patterns
-        has_api = any(word in intent.lower() for word in ["api", "endpoint", "route"])
-        has_auth = any(word in intent.lower() for word in ["auth", "login", "register"])
-        has_db = any(word in intent.lower() for word in ["database", "db", "storage"])
-        has_tests = "test" in intent.lower()
+        # Common patterns (substring matches, so "auth" also covers "authentication")
+        intent_lc = intent.lower()
+        has_api = any(word in intent_lc for word in _API_WORDS)
+        has_auth = any(word in intent_lc for word in _AUTH_WORDS)
+        has_db = any(word in intent_lc for word in _DB_WORDS)
+        has_tests = "test" in intent_lc
         
         # Task 1: Always start with requirements analysis
-        task1_id = str(uuid.uuid4())[:8]
+        task1_id = secrets.token_hex(4)
         subtasks.append(SubTask(
             id=task1_id,
             description="Analyze requirements and existing code",
@@ -91,7 +98,7 @@ class PlanDecomposer:
         ))
         
         # Task 2: Implementation (depends on analysis)
-        task2_id = str(uuid.uuid4())[:8]
+        task2_id = secrets.token_hex(4)
         
         if has_auth:
             desc = "Implement authentication logic"
@@ -115,7 +122,7 @@ class PlanDecomposer:
         
         # Task 3: Tests (if needed, depends on implementation)
         if has_tests or len(intent.split()) > 5:  # Complex tasks need tests
-            task3_id = str(uuid.uuid4())[:8]
+            task3_id = secrets.token_hex(4)
             subtasks.append(SubTask(
                 id=task3_id,
                 description="Add tests and validation",
@@ -241,6 +248,9 @@ class EnhancedBuilderAgent(BuilderAgent):
     - Error recovery
     """
     
+    # Buffered actions that trigger an early flush
+    ACTION_FLUSH_SIZE = 64
+    
     def __init__(
         self,
         policy: Policy,
@@ -272,6 +282,10 @@ class EnhancedBuilderAgent(BuilderAgent):
         
         # Track current session
         self.current_session_id: Optional[str] = None
+        
+        # Actions and costs buffered until the next flush
+        self._pending_actions: List[ActionRecord] = []
+        self._pending_costs: List[CostEntry] = []
     
     def build(self, intent: str) -> BuildResult:
         """
@@ -317,6 +331,7 @@ class EnhancedBuilderAgent(BuilderAgent):
             })
             
             # End trajectory session
+            self._flush_actions()
             self.trajectory_store.end_session(
                 session_id=self.current_session_id,
                 success=base_result.success,
@@ -338,6 +353,7 @@ class EnhancedBuilderAgent(BuilderAgent):
             )
             
             # End session with error
+            self._flush_actions()
             self.trajectory_store.end_session(
                 session_id=self.current_session_id,
                 success=False,
@@ -360,11 +376,15 @@ class EnhancedBuilderAgent(BuilderAgent):
     
     def _execute_subtasks(self, subtasks: List[SubTask]):
         """Execute subtasks in dependency order"""
-        completed_ids = set()
+        # Resolve dependency ids to list positions once; unknown ids map to -1,
+        # which never completes
+        id_to_idx = {task.id: i for i, task in enumerate(subtasks)}
+        dep_idx = [[id_to_idx.get(dep_id, -1) for dep_id in task.dependencies] for task in subtasks]
+        completed = set()
         
-        for subtask in subtasks:
+        for i, subtask in enumerate(subtasks):
             # Check dependencies
-            deps_met = all(dep_id in completed_ids for dep_id in subtask.dependencies)
+            deps_met = all(dep in completed for dep in dep_idx[i])
             
             if not deps_met:
                 subtask.status = TaskStatus.SKIPPED
@@ -389,7 +409,7 @@ class EnhancedBuilderAgent(BuilderAgent):
                 
                 subtask.status = TaskStatus.COMPLETED
                 subtask.result = {"success": True}
-                completed_ids.add(subtask.id)
+                completed.add(i)
                 
             except Exception as e:
                 subtask.status = TaskStatus.FAILED
@@ -410,7 +430,12 @@ class EnhancedBuilderAgent(BuilderAgent):
         cost: float,
         success: bool = True
     ):
-        """Record action to trajectory and cost ledger"""
+        """
+        Record action to trajectory and cost ledger
+        
+        Records are buffered and written in one batch by _flush_actions
+        (at session end, or once ACTION_FLUSH_SIZE are pending).
+        """
         # Record to trajectory
         action = ActionRecord(
             phase=phase,
@@ -420,7 +445,7 @@ class EnhancedBuilderAgent(BuilderAgent):
             cost=cost,
             success=success
         )
-        self.trajectory_store.record_action(self.current_session_id, action)
+        self._pending_actions.append(action)
         
         # Record to cost ledger
         cost_entry = CostEntry(
@@ -430,7 +455,20 @@ class EnhancedBuilderAgent(BuilderAgent):
             cost=cost,
             timestamp=datetime.now()
         )
-        self.cost_ledger.record(cost_entry)
+        self._pending_costs.append(cost_entry)
+        
+        if len(self._pending_actions) >= self.ACTION_FLUSH_SIZE:
+            self._flush_actions()
+    
+    def _flush_actions(self):
+        """Write buffered actions and cost entries with one save each"""
+        if self._pending_actions:
+            actions, self._pending_actions = self._pending_actions, []
+            self.trajectory_store.record_actions(self.current_session_id, actions)
+        
+        if self._pending_costs:
+            costs, self._pending_costs = self._pending_costs, []
+            self.cost_ledger.record_many(costs)
     
     def _subtask_to_dict(self, subtask: SubTask) -> Dict[str, Any]:
         """Convert subtask to dictionary"""
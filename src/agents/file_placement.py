@@ -5,13 +5,15 @@ Analyzes project structure and places generated files in appropriate locations
 following established patterns and conventions.
 """
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Optional, List, Set, Tuple, Union
 from dataclasses import dataclass
+import os
 import re
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectStructure:
     """Detected project structure and conventions"""
     
@@ -49,6 +51,15 @@ class ProjectStructure:
         }
 
 
+# Directories never scanned for project conventions (environments, caches, build output)
+_SKIP_DIRS = frozenset({
+    "venv", "env", ".venv", "virtualenv", "__pycache__", "node_modules", ".git", "dist", "build"
+})
+
+# A "src" path component, as seen in separator-wrapped os.walk dirpaths
+_SRC_SEGMENT = f"{os.sep}src{os.sep}"
+
+
 class FileRoleClassifier:
     """Classify file types and their purposes"""
     
@@ -60,6 +71,13 @@ class FileRoleClassifier:
     SERVICE_KEYWORDS = ["service", "manager", "repository", "dao"]
     UTIL_KEYWORDS = ["util", "helper", "tool", "common"]
     
+    # Intent phrases that indicate file roles ("test" also covers "unit test" etc.)
+    TEST_INTENT_KEYWORDS = ["test"]
+    MODEL_INTENT_KEYWORDS = ["model", "schema", "entity", "data structure"]
+    CONTROLLER_INTENT_KEYWORDS = ["api", "endpoint", "route", "controller", "handler"]
+    SERVICE_INTENT_KEYWORDS = ["service", "business logic", "manager"]
+    UTIL_INTENT_KEYWORDS = ["utility", "helper", "tool"]
+    
     @classmethod
     def classify(cls, filename: str, intent: str) -> str:
         """
@@ -78,7 +96,7 @@ class FileRoleClassifier:
         # Check test
         if any(kw in filename_lower for kw in cls.TEST_KEYWORDS):
             return "test"
-        if any(kw in intent_lower for kw in ["test", "unit test", "integration test"]):
+        if any(kw in intent_lower for kw in cls.TEST_INTENT_KEYWORDS):
             return "test"
         
         # Check config
@@ -88,25 +106,25 @@ class FileRoleClassifier:
         # Check model/domain
         if any(kw in filename_lower for kw in cls.MODEL_KEYWORDS):
             return "model"
-        if any(kw in intent_lower for kw in ["model", "schema", "entity", "data structure"]):
+        if any(kw in intent_lower for kw in cls.MODEL_INTENT_KEYWORDS):
             return "model"
         
         # Check controller/api
         if any(kw in filename_lower for kw in cls.CONTROLLER_KEYWORDS):
             return "controller"
-        if any(kw in intent_lower for kw in ["api", "endpoint", "route", "controller", "handler"]):
+        if any(kw in intent_lower for kw in cls.CONTROLLER_INTENT_KEYWORDS):
             return "controller"
         
         # Check service/business logic
         if any(kw in filename_lower for kw in cls.SERVICE_KEYWORDS):
             return "service"
-        if any(kw in intent_lower for kw in ["service", "business logic", "manager"]):
+        if any(kw in intent_lower for kw in cls.SERVICE_INTENT_KEYWORDS):
             return "service"
         
         # Check utility
         if any(kw in filename_lower for kw in cls.UTIL_KEYWORDS):
             return "util"
-        if any(kw in intent_lower for kw in ["utility", "helper", "tool"]):
+        if any(kw in intent_lower for kw in cls.UTIL_INTENT_KEYWORDS):
             return "util"
         
         # Default to main application code
@@ -124,6 +142,9 @@ class ProjectStructureAnalyzer:
             project_root: Root directory of project
         """
         self.project_root = project_root
+        
+        # Special case: if we're IN the Aureus project, don't use src/ for generated code
+        self._is_aureus_project = "Aureus_Coding_Agent" in str(project_root)
     
     def analyze(self) -> ProjectStructure:
         """
@@ -134,19 +155,23 @@ class ProjectStructureAnalyzer:
         """
         structure = ProjectStructure()
         
-        if not self.project_root.exists():
+        if not self.project_root.is_dir():
             return structure
         
+        # One directory listing answers every top-level probe
+        with os.scandir(self.project_root) as it:
+            top_dirs = {entry.name for entry in it if entry.is_dir()}
+        
         # Check for common directory patterns
-        structure.has_src_dir = (self.project_root / "src").exists()
-        structure.has_lib_dir = (self.project_root / "lib").exists()
-        structure.has_app_dir = (self.project_root / "app").exists()
+        structure.has_src_dir = "src" in top_dirs
+        structure.has_lib_dir = "lib" in top_dirs
+        structure.has_app_dir = "app" in top_dirs
         
         # Check for test directories
         test_dirs = ["tests", "test", "spec", "specs"]
         for test_dir_name in test_dirs:
-            test_path = self.project_root / test_dir_name
-            if test_path.exists():
+            if test_dir_name in top_dirs:
+                test_path = self.project_root / test_dir_name
                 structure.has_tests_dir = True
                 structure.test_dir = test_path
                 structure.prefers_plural_dirs = test_dir_name.endswith("s")
@@ -155,15 +180,14 @@ class ProjectStructureAnalyzer:
         # Determine layout (flat vs src layout)
         structure.uses_flat_layout = not structure.has_src_dir
         
+        # One pruned walk gathers package, naming and code-dir statistics
+        has_init, total_py, underscore_count, py_files_by_dir = self._scan_python_files()
+        
         # Check if it's a package (has __init__.py)
-        init_files = list(self.project_root.glob("**/__init__.py"))
-        structure.is_package = len(init_files) > 0
+        structure.is_package = has_init
         
         # Determine primary code directory
-        # Special case: if we're IN the Aureus project, don't use src/ for generated code
-        is_aureus_project = "Aureus_Coding_Agent" in str(self.project_root)
-        
-        if structure.has_src_dir and not is_aureus_project:
+        if structure.has_src_dir and not self._is_aureus_project:
             structure.primary_code_dir = self.project_root / "src"
         elif structure.has_lib_dir:
             structure.primary_code_dir = self.project_root / "lib"
@@ -172,37 +196,57 @@ class ProjectStructureAnalyzer:
         else:
             # Look for directory with most Python files
             # (will return None for Aureus project due to filtering)
-            structure.primary_code_dir = self._find_primary_code_dir()
+            structure.primary_code_dir = self._find_primary_code_dir(py_files_by_dir)
         
         # Analyze naming conventions (snake_case vs camelCase)
-        py_files = list(self.project_root.glob("**/*.py"))
-        underscore_count = sum(1 for f in py_files if "_" in f.stem)
-        structure.uses_underscores = underscore_count > len(py_files) / 2
+        structure.uses_underscores = underscore_count > total_py / 2
         
         return structure
     
-    def _find_primary_code_dir(self) -> Optional[Path]:
-        """Find directory with most Python files (excluding tests and aureus itself)"""
+    def _scan_python_files(self) -> Tuple[bool, int, int, Dict[Path, int]]:
+        """
+        Walk the project once, skipping virtualenvs, caches and build output
+        
+        Returns:
+            (any __init__.py seen, Python file count, snake_case file count,
+            non-test Python files per directory)
+        """
+        has_init = False
+        total_py = 0
+        underscore_count = 0
         py_files_by_dir: Dict[Path, int] = {}
         
-        for py_file in self.project_root.glob("**/*.py"):
-            # Skip test files
-            if any(test_kw in py_file.stem.lower() for test_kw in ["test_", "_test"]):
-                continue
-            
-            # Skip venv/virtualenv
-            if any(part in ["venv", "env", ".venv", "virtualenv", "__pycache__"] for part in py_file.parts):
-                continue
+        for dirpath, dirnames, filenames in os.walk(self.project_root):
+            # Prune before descending so skipped trees are never listed
+            dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
             
             # Skip aureus's own src directory if we're IN the aureus project
             # This prevents generated files from going into src/ when testing
-            if "Aureus_Coding_Agent" in str(self.project_root) and "src" in py_file.parts:
-                continue
+            # (src files still count towards package and naming detection)
+            count_here = not (self._is_aureus_project and _SRC_SEGMENT in f"{os.sep}{dirpath}{os.sep}")
             
-            # Count files per directory
-            parent = py_file.parent
-            py_files_by_dir[parent] = py_files_by_dir.get(parent, 0) + 1
-        
+            for name in filenames:
+                if not name.endswith(".py"):
+                    continue
+                stem = name[:-3]
+                total_py += 1
+                if "_" in stem:
+                    underscore_count += 1
+                if name == "__init__.py":
+                    has_init = True
+                
+                # Skip test files
+                if not count_here or any(test_kw in stem.lower() for test_kw in ["test_", "_test"]):
+                    continue
+                
+                # Count files per directory
+                parent = Path(dirpath)
+                py_files_by_dir[parent] = py_files_by_dir.get(parent, 0) + 1
+        
+        return has_init, total_py, underscore_count, py_files_by_dir
+    
+    def _find_primary_code_dir(self, py_files_by_dir: Dict[Path, int]) -> Optional[Path]:
+        """Find directory with most Python files (excluding tests and aureus itself)"""
         if not py_files_by_dir:
             return None
         
@@ -210,12 +254,52 @@ class ProjectStructureAnalyzer:
         primary_dir = max(py_files_by_dir.items(), key=lambda x: x[1])[0]
         
         # Don't use src/ if it looks like we're in Aureus project itself
-        if "Aureus_Coding_Agent" in str(self.project_root) and "src" in primary_dir.parts:
+        if self._is_aureus_project and "src" in primary_dir.parts:
             return None
         
         return primary_dir
 
 
+# Analyzed structures keyed by (project root as given, resolved root, root
+# mtime_ns); adding or removing a top-level entry changes the root mtime and
+# forces a re-analysis
+_STRUCTURE_CACHE: "OrderedDict[Tuple[str, str, int], ProjectStructure]" = OrderedDict()
+_STRUCTURE_CACHE_SIZE = 32
+
+
+def clear_structure_cache() -> None:
+    """Forget memoized project structures (e.g. after reorganizing a tree)"""
+    _STRUCTURE_CACHE.clear()
+
+
+def _analyze_cached(analyzer: ProjectStructureAnalyzer) -> ProjectStructure:
+    """
+    Analyze a project, reusing the result for an unchanged project root
+    
+    Args:
+        analyzer: Analyzer for the project root
+    
+    Returns:
+        ProjectStructure (shared between engines; treat as read-only)
+    """
+    try:
+        root = analyzer.project_root.resolve()
+        key = (str(analyzer.project_root), str(root), root.stat().st_mtime_ns)
+    except OSError:
+        return analyzer.analyze()
+    
+    structure = _STRUCTURE_CACHE.get(key)
+    if structure is not None:
+        _STRUCTURE_CACHE.move_to_end(key)
+        return structure
+    
+    structure = analyzer.analyze()
+    _STRUCTURE_CACHE[key] = structure
+    if len(_STRUCTURE_CACHE) > _STRUCTURE_CACHE_SIZE:
+        _STRUCTURE_CACHE.popitem(last=False)
+    return structure
+
+
 class FilePlacementEngine:
     """
     Intelligent file placement based on project structure analysis
@@ -236,13 +320,20 @@ class FilePlacementEngine:
         """
         self.project_root = project_root
         self.analyzer = ProjectStructureAnalyzer(project_root)
-        self.structure = self.analyzer.analyze()
+        self.structure = _analyze_cached(self.analyzer)
+        self._structure_summary: Optional[Dict] = None
+        
+        # Directories this engine has already found or created
+        self._known_dirs: Set[Path] = set()
+        
+        # Placement directory per file role, resolved on first use
+        self._role_dirs: Dict[str, Path] = {}
     
     def determine_file_path(
         self,
         filename: str,
         intent: str,
-        suggested_path: Optional[str] = None
+        suggested_path: Optional[Union[str, Path]] = None
     ) -> Path:
         """
         Determine optimal file path based on project structure
@@ -255,15 +346,30 @@ class FilePlacementEngine:
         Returns:
             Path where file should be created
         """
-        # Classify file role
-        role = FileRoleClassifier.classify(filename, intent)
-        
         # If LLM provided a path, validate and use if safe
         if suggested_path:
             target_path = self._validate_suggested_path(suggested_path)
             if target_path:
                 return target_path
         
+        # Classify file role
+        role = FileRoleClassifier.classify(filename, intent)
+        
+        role_dir = self._role_dirs.get(role)
+        if role_dir is None:
+            role_dir = self._role_dirs[role] = self._resolve_role_directory(role)
+        return role_dir / filename
+    
+    def _resolve_role_directory(self, role: str) -> Path:
+        """
+        Directory files of the given role are placed in
+        
+        Args:
+            role: Role from FileRoleClassifier.classify
+        
+        Returns:
+            Placement directory (created if needed)
+        """
         # Determine base directory based on role
         if role == "test":
             base_dir = self._get_test_directory()
@@ -284,9 +390,9 @@ class FilePlacementEngine:
         else:
             subdir = base_dir
         
-        return subdir / filename
+        return subdir
     
-    def _validate_suggested_path(self, suggested_path: str) -> Optional[Path]:
+    def _validate_suggested_path(self, suggested_path: Union[str, Path]) -> Optional[Path]:
         """
         Validate suggested path for security
         
@@ -299,33 +405,33 @@ class FilePlacementEngine:
             Validated path or None if invalid
         """
         try:
-            path = Path(suggested_path)
-            
-            # Reject absolute paths
-            if path.is_absolute():
-                return None
-            
-            # Reject parent traversal
-            if ".." in path.parts:
-                return None
-            
-            # If suggested path is just a filename (no directory), don't use it
-            # Let the role-based placement handle it
-            if len(path.parts) == 1:
-                return None
-            
-            # Construct full path
-            full_path = self.project_root / path
-            
-            # Ensure it's within project root
-            try:
-                full_path.relative_to(self.project_root)
-                return full_path
-            except ValueError:
-                return None
-        
-        except Exception:
+            raw = os.fspath(suggested_path)
+        except TypeError:
             return None
+        
+        # Reject absolute and drive-qualified paths (D:foo is relative but not to the root)
+        if os.path.isabs(raw) or os.path.splitdrive(raw)[0]:
+            return None
+        
+        # Same components Path.parts would give: empty and "." segments drop out
+        parts = [part for part in raw.replace(os.sep, "/").split("/") if part not in ("", ".")]
+        
+        # Reject parent traversal
+        if ".." in parts:
+            return None
+        
+        # If suggested path is just a filename (no directory), don't use it
+        # Let the role-based placement handle it
+        if len(parts) < 2:
+            return None
+        
+        # Ensure it's within project root
+        full_path = self.project_root / raw
+        try:
+            full_path.relative_to(self.project_root)
+        except ValueError:
+            return None
+        return full_path
     
     def _get_test_directory(self) -> Path:
         """Get test directory (tests/ or test/)"""
@@ -335,70 +441,87 @@ class FilePlacementEngine:
         # Create tests directory using plural convention
         test_dir_name = "tests" if self.structure.prefers_plural_dirs else "test"
         test_dir = self.project_root / test_dir_name
-        test_dir.mkdir(parents=True, exist_ok=True)
-        return test_dir
+        return self._ensure_dir(test_dir)
     
     def _get_code_directory(self) -> Path:
         """Get primary code directory"""
         # Always use workspace/ for backward compatibility and safety
         # Don't pollute existing code directories with generated files
         workspace_dir = self.project_root / "workspace"
-        workspace_dir.mkdir(parents=True, exist_ok=True)
-        return workspace_dir
+        return self._ensure_dir(workspace_dir)
     
     def _get_models_directory(self, base_dir: Path) -> Path:
         """Get models directory"""
-        # Check for existing models directory
-        candidates = ["models", "model", "domain", "entities"]
-        for candidate in candidates:
-            dir_path = base_dir / candidate
-            if dir_path.exists():
-                return dir_path
-        
-        # Create new models directory
-        models_dir = base_dir / ("models" if self.structure.prefers_plural_dirs else "model")
-        models_dir.mkdir(parents=True, exist_ok=True)
-        return models_dir
+        return self._get_role_subdir(base_dir, ("models", "model", "domain", "entities"), "models", "model")
     
     def _get_controllers_directory(self, base_dir: Path) -> Path:
         """Get controllers directory"""
-        candidates = ["controllers", "controller", "handlers", "api", "routes"]
-        for candidate in candidates:
-            dir_path = base_dir / candidate
-            if dir_path.exists():
-                return dir_path
-        
-        # Create controllers directory
-        controllers_dir = base_dir / ("controllers" if self.structure.prefers_plural_dirs else "controller")
-        controllers_dir.mkdir(parents=True, exist_ok=True)
-        return controllers_dir
+        return self._get_role_subdir(
+            base_dir, ("controllers", "controller", "handlers", "api", "routes"), "controllers", "controller"
+        )
     
     def _get_services_directory(self, base_dir: Path) -> Path:
         """Get services directory"""
-        candidates = ["services", "service", "business", "logic"]
-        for candidate in candidates:
-            dir_path = base_dir / candidate
-            if dir_path.exists():
-                return dir_path
-        
-        # Create services directory
-        services_dir = base_dir / ("services" if self.structure.prefers_plural_dirs else "service")
-        services_dir.mkdir(parents=True, exist_ok=True)
-        return services_dir
+        return self._get_role_subdir(base_dir, ("services", "service", "business", "logic"), "services", "service")
     
     def _get_utils_directory(self, base_dir: Path) -> Path:
         """Get utilities directory"""
-        candidates = ["utils", "util", "helpers", "common"]
+        return self._get_role_subdir(base_dir, ("utils", "util", "helpers", "common"), "utils", "util")
+    
+    def _get_role_subdir(
+        self,
+        base_dir: Path,
+        candidates: Tuple[str, ...],
+        plural: str,
+        singular: str
+    ) -> Path:
+        """
+        Reuse an existing role directory under base_dir, or create one
+        
+        Args:
+            base_dir: Directory holding role subdirectories
+            candidates: Existing directory names to reuse, in preference order
+            plural: Name to create when prefers_plural_dirs
+            singular: Name to create otherwise
+        
+        Returns:
+            Role directory (exists on return)
+        """
+        existing = self._find_existing_subdir(base_dir, candidates)
+        if existing is not None:
+            return existing
+        
+        return self._ensure_dir(base_dir / (plural if self.structure.prefers_plural_dirs else singular))
+    
+    def _find_existing_subdir(self, base_dir: Path, candidates: Tuple[str, ...]) -> Optional[Path]:
+        """First candidate that is a directory under base_dir (one listing, no per-name stat)"""
         for candidate in candidates:
             dir_path = base_dir / candidate
-            if dir_path.exists():
+            if dir_path in self._known_dirs:
                 return dir_path
         
-        # Create utils directory
-        utils_dir = base_dir / ("utils" if self.structure.prefers_plural_dirs else "util")
-        utils_dir.mkdir(parents=True, exist_ok=True)
-        return utils_dir
+        try:
+            with os.scandir(base_dir) as it:
+                subdirs = {entry.name for entry in it if entry.is_dir()}
+        except OSError:
+            return None
+        
+        for candidate in candidates:
+            if candidate in subdirs:
+                dir_path = base_dir / candidate
+                self._known_dirs.add(dir_path)
+                return dir_path
+        return None
+    
+    def _ensure_dir(self, dir_path: Path) -> Path:
+        """Create a directory unless this engine already found or created it"""
+        if dir_path not in self._known_dirs:
+            dir_path.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(dir_path)
+        return dir_path
     
     def get_structure_summary(self) -> Dict:
-        """Get summary of detected project structure"""
-        return self.structure.to_dict()
+        """Get summary of detected project structure (serialized once)"""
+        if self._structure_summary is None:
+            self._structure_summary = self.structure.to_dict()
+        return self._structure_summary
@@ -5,10 +5,19 @@ Unified goal-driven agent swarm for code generation.
 Multiple specialized agents coordinate to build high-quality code.
 """
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
+import heapq
+import itertools
+import re
+
+
+# LLM response parsing
+_FILE_RE = re.compile(r'FILE:\s*(\S+)')
+_CODE_RE = re.compile(r'```python\n(.*?)\n```', re.DOTALL)
 
 
 class AgentRole(Enum):
@@ -21,7 +30,7 @@ class AgentRole(Enum):
     ARCHITECT = "architect"  # Designs structure
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentMessage:
     """Message between agents"""
     sender: str
@@ -31,14 +40,14 @@ class AgentMessage:
     priority: int = 5  # 1-10, higher is more urgent
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentTask:
     """Task for an agent"""
     task_id: str
     role: AgentRole
     description: str
     inputs: Dict[str, Any]
-    dependencies: List[str] = None  # Task IDs this depends on
+    dependencies: List[str] = field(default_factory=list)  # Task IDs this depends on
     status: str = "pending"  # pending | in_progress | completed | failed
     result: Any = None
     error: Optional[str] = None
@@ -50,14 +59,22 @@ class BaseAgent:
     def __init__(self, agent_id: str, role: AgentRole):
         self.agent_id = agent_id
         self.role = role
-        self.inbox: List[AgentMessage] = []
+        # Min-heap of (-priority, arrival order, message): most urgent first, FIFO within a priority
+        self.inbox: List[Tuple[int, int, AgentMessage]] = []
+        self._inbox_seq = itertools.count()
         self.outbox: List[AgentMessage] = []
         self.current_task: Optional[AgentTask] = None
         self.completed_tasks: List[AgentTask] = []
     
     def receive_message(self, message: AgentMessage):
         """Receive a message from another agent"""
-        self.inbox.append(message)
+        heapq.heappush(self.inbox, (-message.priority, next(self._inbox_seq), message))
+    
+    def pop_highest_priority(self) -> Optional[AgentMessage]:
+        """Remove and return the most urgent inbox message (oldest first on ties), or None if empty"""
+        if not self.inbox:
+            return None
+        return heapq.heappop(self.inbox)[2]
     
     def send_message(self, message: AgentMessage):
         """Send a message to another agent"""
@@ -156,35 +173,56 @@ class CoordinatorAgent(BaseAgent):
         """
         Execute tasks with dependency management and global value alignment
         
+        Tasks whose dependencies are met run together in rounds; the tasks of
+        one round execute concurrently and their results are applied in list
+        order.
+        
         Returns:
             Results aggregated from all agents
         """
         results = {}
         completed_task_ids = set()
         
-        while len(completed_task_ids) < len(tasks):
-            # Find tasks ready to execute (dependencies met)
-            ready_tasks = [
-                task for task in tasks
-                if task.task_id not in completed_task_ids
-                and (not task.dependencies or all(dep in completed_task_ids for dep in task.dependencies))
-            ]
-            
-            if not ready_tasks:
-                break  # No more tasks can be executed
-            
-            # Execute ready tasks
-            for task in ready_tasks:
-                agent = self.agents.get(task.role)
-                if agent:
-                    # Pass previous results as input
-                    if task.dependencies:
-                        for dep_id in task.dependencies:
-                            task.inputs[dep_id] = results.get(dep_id)
-                    
-                    # Execute
-                    result_task = agent.execute_task(task)
-                    
+        # Count unmet dependencies per task and index tasks by what they wait on,
+        # so each completion only touches its own dependents
+        waiting: List[int] = []
+        dependents: Dict[str, List[int]] = {}
+        for index, task in enumerate(tasks):
+            deps = set(task.dependencies or ())
+            waiting.append(len(deps))
+            for dep in deps:
+                dependents.setdefault(dep, []).append(index)
+        
+        # Tasks run in rounds: every task ready at the start of a round, in list order
+        ready = [index for index, count in enumerate(waiting) if count == 0]
+        
+        # Independent tasks in a round overlap their (LLM-bound) execution;
+        # results are still applied one by one in list order
+        executor = None
+        try:
+            while ready:
+                runnable = []
+                for index in ready:
+                    task = tasks[index]
+                    agent = self.agents.get(task.role)
+                    if agent:
+                        # Pass previous results as input
+                        if task.dependencies:
+                            for dep_id in task.dependencies:
+                                task.inputs[dep_id] = results.get(dep_id)
+                        runnable.append((task, agent))
+                
+                # Execute
+                if len(runnable) > 1:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=min(8, len(tasks)))
+                    futures = [executor.submit(agent.execute_task, task) for task, agent in runnable]
+                    outcomes = (future.result() for future in futures)
+                else:
+                    outcomes = (agent.execute_task(task) for task, agent in runnable)
+                
+                unlocked = []
+                for (task, agent), result_task in zip(runnable, outcomes):
                     # ===== GLOBAL VALUE FUNCTION VALIDATION =====
                     if self.global_value_memory and result_task.result:
                         action = {
@@ -210,6 +248,16 @@ class CoordinatorAgent(BaseAgent):
                     
                     results[task.task_id] = result_task.result
                     completed_task_ids.add(task.task_id)
+                    
+                    for child in dependents.get(task.task_id, ()):
+                        waiting[child] -= 1
+                        if waiting[child] == 0:
+                            unlocked.append(child)
+                
+                ready = sorted(unlocked)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
         
         return results
 
@@ -262,12 +310,11 @@ class CodeGeneratorAgent(BaseAgent):
     
     def _extract_files(self, content: str) -> List[Dict[str, str]]:
         """Extract file paths and code from LLM response"""
-        import re
         files = []
         
         # Match FILE: path and ```python code ``` blocks
-        file_matches = re.finditer(r'FILE:\s*(\S+)', content)
-        code_matches = re.finditer(r'```python\n(.*?)\n```', content, re.DOTALL)
+        file_matches = _FILE_RE.finditer(content)
+        code_matches = _CODE_RE.finditer(content)
         
         for file_match, code_match in zip(file_matches, code_matches):
             files.append({
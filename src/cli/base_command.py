@@ -0,0 +1,104 @@
+"""
+Base class for AUREUS CLI commands.
+
+Holds the options every command shares (project root, verbosity, dry-run)
+and the helpers commands use to run their work and shape result dictionaries.
+"""
+
+import argparse
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+
+class BaseCommand:
+    """Shared state and result helpers for CLI commands."""
+
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        verbose: bool = False,
+        dry_run: bool = False
+    ):
+        self.project_root = Path(project_root) if project_root else Path.cwd()
+        self.verbose = verbose
+        self.dry_run = dry_run
+
+    def execute(self, args: Optional[argparse.Namespace] = None) -> Dict[str, Any]:
+        """
+        Execute the command.
+
+        Args:
+            args: Optional parsed arguments
+
+        Returns:
+            Result dictionary with status
+        """
+        raise NotImplementedError
+
+    def _handle_execution(
+        self,
+        operation: Callable[..., Dict[str, Any]],
+        *args: Any,
+        context: str,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """
+        Run a command operation, turning unexpected failures into an error result.
+
+        CLIError is re-raised so the CLI reports it and exits non-zero.
+
+        Args:
+            operation: Callable doing the command's work
+            *args: Positional arguments for the operation
+            context: Short description of the operation for error messages
+            **kwargs: Keyword arguments for the operation
+
+        Returns:
+            The operation's result, or an error result
+        """
+        from src.cli.main import CLIError
+
+        try:
+            return operation(*args, **kwargs)
+        except CLIError:
+            raise
+        except Exception as e:
+            return self._format_error(e, context)
+
+    def _format_success(self, message: str, **data: Any) -> Dict[str, Any]:
+        """Build a success result carrying any extra fields"""
+        return {"status": "success", "message": message, **data}
+
+    def _format_error(self, error: Exception, context: str) -> Dict[str, Any]:
+        """Build an error result for a failed operation"""
+        return {
+            "status": "error",
+            "message": f"{context} failed: {error}",
+            "error": str(error)
+        }
+
+    def _verbose_print(self, message: str, **details: Any) -> None:
+        """Print a progress message in verbose mode"""
+        if not self.verbose:
+            return
+        if details:
+            message += " (" + ", ".join(f"{key}={value}" for key, value in details.items()) + ")"
+        print(f"[verbose] {message}")
+
+    def _dry_run_print(self, message: str) -> None:
+        """Announce what a dry run skips"""
+        print(f"[DRY RUN] {message}")
+
+    def _validate_file_exists(self, path: Union[str, Path]) -> Path:
+        """
+        Ensure a file exists before a command reads it.
+
+        Raises:
+            CLIError: If the file does not exist
+        """
+        from src.cli.main import CLIError
+
+        path = Path(path)
+        if not path.exists():
+            raise CLIError(f"File not found: {path}")
+        return path
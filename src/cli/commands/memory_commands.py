@@ -10,12 +10,15 @@ Provides user-facing commands for interacting with Aureus memory system:
 """
 
 import click
+import functools
 from pathlib import Path
 from typing import Optional
 import json
 from datetime import datetime
-from src.memory.trajectory import TrajectoryStore
-from src.memory.summarization import TrajectorySummarizer, PatternExtractor
+
+
+# One list-sessions row: ID, intent, status, cost, start time
+_SESSION_ROW_FORMAT = "{:<10} {:<40} {:<10} {:<8.1f} {:%Y-%m-%d %H:%M}"
 
 
 @click.group(name='memory')
@@ -52,7 +55,7 @@ def list_sessions(storage_dir: str, limit: Optional[int], format: str):
         aureus memory list-sessions --limit 10
         aureus memory list-sessions --format json
     """
-    store = TrajectoryStore(storage_dir=Path(storage_dir))
+    store = _get_store(storage_dir)
     sessions = store.list_sessions(limit=limit)
     
     if not sessions:
@@ -60,7 +63,7 @@ def list_sessions(storage_dir: str, limit: Optional[int], format: str):
         return
     
     if format == 'json':
-        _output_json([s.to_dict() for s in sessions])
+        _output_json(sessions)
     elif format == 'simple':
         for session in sessions:
             click.echo(f"{session.session_id}: {session.intent}")
@@ -101,7 +104,7 @@ def show_trajectory(
         aureus memory show-trajectory abc123 --format json
         aureus memory show-trajectory abc123 --no-actions
     """
-    store = TrajectoryStore(storage_dir=Path(storage_dir))
+    store = _get_store(storage_dir)
     session = store.get_session(session_id)
     
     if not session:
@@ -109,7 +112,7 @@ def show_trajectory(
         return
     
     if format == 'json':
-        _output_json(session.to_dict())
+        _output_json(session)
     elif format == 'summary':
         _output_trajectory_summary(session)
     else:  # detailed
@@ -144,6 +147,7 @@ def show_patterns(storage_dir: str, min_frequency: int, format: str):
         aureus memory show-patterns --min-frequency 3
         aureus memory show-patterns --format json
     """
+    from src.memory.summarization import PatternExtractor
     extractor = PatternExtractor(storage_dir=Path(storage_dir))
     patterns = extractor.extract_successful_patterns()
     
@@ -197,7 +201,7 @@ def export_adr(
         aureus memory export-adr abc123 --output decisions/adr-001.md
         aureus memory export-adr abc123 --format yaml
     """
-    store = TrajectoryStore(storage_dir=Path(storage_dir))
+    store = _get_store(storage_dir)
     session = store.get_session(session_id)
     
     if not session:
@@ -239,10 +243,10 @@ def memory_stats(storage_dir: str, format: str):
         aureus memory memory-stats
         aureus memory memory-stats --format json
     """
-    store = TrajectoryStore(storage_dir=Path(storage_dir))
-    sessions = store.list_sessions()
+    store = _get_store(storage_dir)
     
-    stats = _calculate_stats(sessions)
+    # Stats only need per-session totals, not full trajectories
+    stats = _calculate_stats(store.session_summaries())
     
     if format == 'json':
         _output_json(stats)
@@ -252,57 +256,92 @@ def memory_stats(storage_dir: str, format: str):
 
 # === Output Formatting Functions ===
 
+def _get_store(storage_dir: str):
+    """Open the trajectory store, shared by every command using the same directory"""
+    return _store_for(str(Path(storage_dir).resolve()))
+
+
+@functools.lru_cache(maxsize=8)
+def _store_for(resolved_dir: str):
+    """Trajectory store for a resolved directory (imported here so `--help` stays cheap)"""
+    from src.memory.trajectory import TrajectoryStore
+    return TrajectoryStore(storage_dir=Path(resolved_dir))
+
+
 def _output_json(data):
     """Output data as JSON"""
-    click.echo(json.dumps(data, indent=2, default=str))
+    click.echo(json.dumps(data, indent=2, default=_json_default))
+
+
+def _json_default(obj):
+    """
+    Serialize values JSON has no type for
+    
+    Sessions and other records are converted with their own to_dict() as the
+    encoder reaches them, so a session list never holds every dict at once.
+    """
+    to_dict = getattr(obj, 'to_dict', None)
+    if callable(to_dict):
+        return to_dict()
+    return str(obj)
 
 
 def _output_sessions_table(sessions):
     """Output sessions as formatted table"""
-    click.echo(f"\n{'ID':<10} {'Intent':<40} {'Status':<10} {'Cost':<8} {'Time'}")
-    click.echo("=" * 90)
+    # Collect the whole table and write it with one echo
+    lines = [f"\n{'ID':<10} {'Intent':<40} {'Status':<10} {'Cost':<8} {'Time'}", "=" * 90]
     
+    row_format = _SESSION_ROW_FORMAT.format
     for session in sessions:
         status = "✓ Success" if session.success else "✗ Failed"
-        cost = f"{session.total_cost:.1f}"
-        time = session.start_time.strftime("%Y-%m-%d %H:%M")
-        
         intent_short = session.intent[:37] + "..." if len(session.intent) > 40 else session.intent
         
-        click.echo(f"{session.session_id[:8]:<10} {intent_short:<40} {status:<10} {cost:<8} {time}")
+        lines.append(row_format(session.session_id[:8], intent_short, status, session.total_cost, session.start_time))
     
-    click.echo(f"\nTotal sessions: {len(sessions)}")
+    lines.append(f"\nTotal sessions: {len(sessions)}")
+    click.echo("\n".join(lines))
 
 
 def _output_trajectory_summary(session):
     """Output session trajectory summary"""
-    click.echo(f"\n=== Session {session.session_id} ===\n")
-    click.echo(f"Intent: {session.intent}")
-    click.echo(f"Status: {'Success' if session.success else 'Failed'}")
-    click.echo(f"Start Time: {session.start_time}")
+    click.echo("\n".join(_trajectory_summary_lines(session)))
+
+
+def _trajectory_summary_lines(session):
+    """Lines of the session trajectory summary"""
+    lines = [
+        f"\n=== Session {session.session_id} ===\n",
+        f"Intent: {session.intent}",
+        f"Status: {'Success' if session.success else 'Failed'}",
+        f"Start Time: {session.start_time}",
+    ]
     if session.end_time:
         duration = (session.end_time - session.start_time).total_seconds()
-        click.echo(f"Duration: {duration:.1f}s")
-    click.echo(f"Total Cost: {session.total_cost}")
-    click.echo(f"Actions: {len(session.actions)}")
+        lines.append(f"Duration: {duration:.1f}s")
+    lines.append(f"Total Cost: {session.total_cost}")
+    lines.append(f"Actions: {len(session.actions)}")
     if session.outcome:
-        click.echo(f"Outcome: {session.outcome}")
+        lines.append(f"Outcome: {session.outcome}")
+    return lines
 
 
 def _output_trajectory_detailed(session, show_actions: bool):
-    """Output detailed session trajectory"""
-    _output_trajectory_summary(session)
+    """Output detailed session trajectory (summary and actions in one write)"""
+    lines = _trajectory_summary_lines(session)
     
     if show_actions and session.actions:
-        click.echo(f"\n=== Actions ({len(session.actions)}) ===\n")
+        lines.append(f"\n=== Actions ({len(session.actions)}) ===\n")
         for i, action in enumerate(session.actions, 1):
-            click.echo(f"{i}. {action.action_type}")
-            click.echo(f"   Tool: {action.tool_name}")
-            click.echo(f"   Cost: {action.cost_incurred}")
+            lines.extend((
+                f"{i}. {action.action_type}",
+                f"   Tool: {action.tool_name}",
+                f"   Cost: {action.cost_incurred}",
+            ))
             if action.result:
-                result_str = str(action.result)[:80]
-                click.echo(f"   Result: {result_str}...")
-            click.echo()
+                lines.append(f"   Result: {str(action.result)[:80]}...")
+            lines.append("")
+    
+    click.echo("\n".join(lines))
 
 
 def _output_patterns_table(patterns):
@@ -310,19 +349,19 @@ def _output_patterns_table(patterns):
     if not patterns:
         return
     
-    click.echo(f"\n{'Pattern':<50} {'Success Rate':<15} {'Avg Cost'}")
-    click.echo("=" * 80)
+    lines = [f"\n{'Pattern':<50} {'Success Rate':<15} {'Avg Cost'}", "=" * 80]
     
     for pattern in patterns:
         if isinstance(pattern, dict):
             name = pattern.get('name', 'Unknown')[:47] + "..."
             success_rate = f"{pattern.get('success_rate', 0):.1%}"
             avg_cost = f"{pattern.get('avg_cost', 0):.1f}"
-            click.echo(f"{name:<50} {success_rate:<15} {avg_cost}")
+            lines.append(f"{name:<50} {success_rate:<15} {avg_cost}")
         else:
-            click.echo(str(pattern))
+            lines.append(str(pattern))
     
-    click.echo(f"\nTotal patterns: {len(patterns)}")
+    lines.append(f"\nTotal patterns: {len(patterns)}")
+    click.echo("\n".join(lines))
 
 
 def _output_patterns_detailed(patterns):
@@ -352,19 +391,20 @@ def _generate_adr_markdown(session) -> str:
 
 """
     
+    # Collect the pieces and join once instead of growing a string per action
+    parts = [adr]
     if session.actions:
-        adr += "### Actions Taken\n\n"
-        for action in session.actions:
-            adr += f"- {action.action_type} using {action.tool_name}\n"
+        parts.append("### Actions Taken\n\n")
+        parts.extend(f"- {action.action_type} using {action.tool_name}\n" for action in session.actions)
     
-    adr += f"\n## Consequences\n\n"
-    adr += f"**Total Cost**: {session.total_cost} LOC\n"
-    adr += f"**Success**: {session.success}\n"
+    parts.append("\n## Consequences\n\n")
+    parts.append(f"**Total Cost**: {session.total_cost} LOC\n")
+    parts.append(f"**Success**: {session.success}\n")
     
     if session.outcome:
-        adr += f"\n{session.outcome}\n"
+        parts.append(f"\n{session.outcome}\n")
     
-    return adr
+    return "".join(parts)
 
 
 def _generate_adr_yaml(session) -> str:
@@ -426,43 +466,39 @@ def _generate_adr_json(session) -> str:
     return json.dumps(adr_data, indent=2, default=str)
 
 
-def _calculate_stats(sessions):
-    """Calculate memory system statistics"""
-    if not sessions:
-        return {
-            'total_sessions': 0,
-            'successful_sessions': 0,
-            'failed_sessions': 0,
-            'success_rate': 0.0,
-            'total_cost': 0.0,
-            'avg_cost_per_session': 0.0,
-            'total_actions': 0
-        }
-    
-    successful = sum(1 for s in sessions if s.success)
-    total_cost = sum(s.total_cost for s in sessions)
-    total_actions = sum(len(s.actions) for s in sessions)
+def _calculate_stats(summaries):
+    """Calculate memory system statistics from (success, cost, action count) summaries"""
+    total = successful = total_actions = 0
+    total_cost = 0.0
+    for success, cost, action_count in summaries:
+        total += 1
+        if success:
+            successful += 1
+        total_cost += cost
+        total_actions += action_count
     
     return {
-        'total_sessions': len(sessions),
+        'total_sessions': total,
         'successful_sessions': successful,
-        'failed_sessions': len(sessions) - successful,
-        'success_rate': successful / len(sessions) if sessions else 0.0,
+        'failed_sessions': total - successful,
+        'success_rate': successful / total if total else 0.0,
         'total_cost': total_cost,
-        'avg_cost_per_session': total_cost / len(sessions) if sessions else 0.0,
+        'avg_cost_per_session': total_cost / total if total else 0.0,
         'total_actions': total_actions,
-        'avg_actions_per_session': total_actions / len(sessions) if sessions else 0.0
+        'avg_actions_per_session': total_actions / total if total else 0.0
     }
 
 
 def _output_stats_table(stats):
     """Output statistics as formatted table"""
-    click.echo(f"\n=== Memory System Statistics ===\n")
-    click.echo(f"Total Sessions:       {stats['total_sessions']}")
-    click.echo(f"Successful Sessions:  {stats['successful_sessions']}")
-    click.echo(f"Failed Sessions:      {stats['failed_sessions']}")
-    click.echo(f"Success Rate:         {stats['success_rate']:.1%}")
-    click.echo(f"Total Cost:           {stats['total_cost']:.1f} LOC")
-    click.echo(f"Avg Cost/Session:     {stats['avg_cost_per_session']:.1f} LOC")
-    click.echo(f"Total Actions:        {stats['total_actions']}")
-    click.echo(f"Avg Actions/Session:  {stats['avg_actions_per_session']:.1f}")
+    click.echo("\n".join([
+        f"\n=== Memory System Statistics ===\n",
+        f"Total Sessions:       {stats['total_sessions']}",
+        f"Successful Sessions:  {stats['successful_sessions']}",
+        f"Failed Sessions:      {stats['failed_sessions']}",
+        f"Success Rate:         {stats['success_rate']:.1%}",
+        f"Total Cost:           {stats['total_cost']:.1f} LOC",
+        f"Avg Cost/Session:     {stats['avg_cost_per_session']:.1f} LOC",
+        f"Total Actions:        {stats['total_actions']}",
+        f"Avg Actions/Session:  {stats['avg_actions_per_session']:.1f}",
+    ]))
@@ -13,6 +13,13 @@ from dataclasses import dataclass
 from src.governance.policy import Policy, Budget, PolicyLoader
 
 
+# Source file extensions counted towards project size
+_SOURCE_EXTENSIONS = (".py", ".js", ".ts", ".java", ".go", ".rb", ".rs", ".cpp", ".c")
+
+# Dependency, cache and build directories never descended into
+_IGNORED_DIRS = frozenset({"node_modules", ".venv", "venv", "__pycache__", "dist", "build"})
+
+
 @dataclass
 class ProjectInfo:
     """Detected project information"""
@@ -205,37 +212,32 @@ class OnboardingWizard:
         
         return None
     
+    def _iter_source_files(self):
+        """Yield source file paths from one walk, pruning ignored directories"""
+        for dirpath, dirnames, filenames in os.walk(self.project_root):
+            # Prune before descending so ignored trees are never listed
+            dirnames[:] = [d for d in dirnames if d not in _IGNORED_DIRS]
+            
+            for name in filenames:
+                if name.endswith(_SOURCE_EXTENSIONS):
+                    yield os.path.join(dirpath, name)
+    
     def _count_loc(self) -> int:
         """Count lines of code (simple heuristic)"""
         total = 0
-        extensions = [".py", ".js", ".ts", ".java", ".go", ".rb", ".rs", ".cpp", ".c"]
         
-        for ext in extensions:
-            for file in self.project_root.rglob(f"*{ext}"):
-                # Skip common ignore patterns
-                if any(part in file.parts for part in ["node_modules", ".venv", "venv", "__pycache__", "dist", "build"]):
-                    continue
-                
-                try:
-                    with open(file, "r", encoding="utf-8", errors="ignore") as f:
-                        total += sum(1 for line in f if line.strip())
-                except Exception:
-                    continue
+        for file in self._iter_source_files():
+            try:
+                with open(file, "r", encoding="utf-8", errors="ignore") as f:
+                    total += sum(1 for line in f if line.strip())
+            except Exception:
+                continue
         
         return total
     
     def _count_files(self) -> int:
         """Count source files"""
-        count = 0
-        extensions = [".py", ".js", ".ts", ".java", ".go", ".rb", ".rs", ".cpp", ".c"]
-        
-        for ext in extensions:
-            for file in self.project_root.rglob(f"*{ext}"):
-                if any(part in file.parts for part in ["node_modules", ".venv", "venv", "__pycache__", "dist", "build"]):
-                    continue
-                count += 1
-        
-        return count
+        return sum(1 for _ in self._iter_source_files())
     
     def _has_tests(self) -> bool:
         """Check if project has tests"""
@@ -8,17 +8,43 @@ Entry point for all AUREUS operations:
 """
 
 import argparse
+import functools
+import importlib
 import sys
 import signal
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
-from datetime import datetime
+from itertools import zip_longest
 
-from src.interfaces import Policy, Budget
-from src.governance.policy import PolicyLoader, PolicyLoadError
 from src.cli.base_command import BaseCommand
 
+# Policy names are imported on first use (the policy loader pulls in yaml), so
+# --help and argument errors don't pay for them. Commands look them up through
+# _lazy() so patches on src.cli.main.<name> still take effect.
+_LAZY_IMPORTS = {
+    "Policy": "src.interfaces",
+    "Budget": "src.interfaces",
+    "PolicyLoader": "src.governance.policy",
+    "PolicyLoadError": "src.governance.policy",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily imported module attributes (PEP 562)"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Look up a lazily imported name on this module"""
+    return getattr(sys.modules[__name__], name)
+
+
 # Global flag for graceful cancellation
 _cancellation_requested = False
 
@@ -48,7 +74,7 @@ class CLIError(Exception):
 # CLI Argument Parser
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ParsedArgs:
     """Parsed command line arguments."""
     command: str
@@ -61,6 +87,58 @@ class ParsedArgs:
     interactive: bool = False  # For init command: interactive wizard
 
 
+# Subcommand parsers are built on first use and reused for later parses
+
+@functools.lru_cache(maxsize=None)
+def _init_parser() -> argparse.ArgumentParser:
+    """Parser for 'init' options"""
+    parser = argparse.ArgumentParser(prog="aureus init")
+    parser.add_argument("--policy", dest="policy_path", help="Policy file path")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument("--interactive", "-i", action="store_true", help="Interactive setup wizard")
+    parser.add_argument("--force", "-f", action="store_true", help="Overwrite existing policy")
+    return parser
+
+
+@functools.lru_cache(maxsize=None)
+def _code_parser() -> argparse.ArgumentParser:
+    """Parser for 'code' intent words and options"""
+    parser = argparse.ArgumentParser(prog="aureus code")
+    parser.add_argument("intent", nargs="*", help="What to build")
+    parser.add_argument("--policy", dest="policy_path", help="Policy file path")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output with full error traces")
+    parser.add_argument("--dry-run", action="store_true", help="Preview changes without writing files")
+    parser.add_argument("--stream", action="store_true", default=True, help="Stream output in real-time (default: ON)")
+    parser.add_argument("--no-stream", dest="stream", action="store_false", help="Disable streaming for clean logs")
+    return parser
+
+
+@functools.lru_cache(maxsize=None)
+def _status_parser() -> argparse.ArgumentParser:
+    """Parser for 'status' options"""
+    parser = argparse.ArgumentParser(prog="aureus status")
+    parser.add_argument("--policy", dest="policy_path", help="Policy file path")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    return parser
+
+
+@functools.lru_cache(maxsize=None)
+def _budget_parser() -> argparse.ArgumentParser:
+    """Parser for 'budget' options"""
+    parser = argparse.ArgumentParser(
+        prog="aureus budget",
+        description="Show project budget usage dashboard",
+    )
+    parser.add_argument("--policy", dest="policy_path", help="Policy file path")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="Show per-session build history")
+    parser.add_argument("--no-color", dest="no_color", action="store_true",
+                        help="Disable ANSI color codes (for plain-text logs)")
+    parser.add_argument("--reset", action="store_true",
+                        help="Reset all budget counters (keeps policy limits)")
+    return parser
+
+
 class CLIParser:
     """
     Parse AUREUS command line arguments.
@@ -72,6 +150,16 @@ class CLIParser:
     - explain [last|last-rejection|<decision-id>]: Explain decision
     """
     
+    def __init__(self):
+        # Commands parsed into ParsedArgs (the rest are handed off in parse())
+        self._dispatch = {
+            "init": self._parse_init,
+            "code": self._parse_code,
+            "status": self._parse_status,
+            "budget": self._parse_budget,
+            "explain": self._parse_explain,
+        }
+    
     def parse(self, args: List[str]) -> ParsedArgs:
         """
         Parse command line arguments.
@@ -89,10 +177,6 @@ class CLIParser:
             raise CLIError("No command specified. Use: init, code, status, budget, explain, memory, history, test-gen, find, usages, impact, test, validate, lint, debug, refactor, review, doctor, adr, skills, learn")
         
         command = args[0]
-
-        # Handle budget dashboard command
-        if command == "budget":
-            return self._parse_budget(args[1:])
         
         # Handle test-gen separately (delegates to test_commands.py)
         if command == "test-gen":
@@ -199,26 +283,14 @@ class CLIParser:
             sys.exit(handle_collaborate_command(parsed_args))
         
         # Parse based on command
-        if command == "init":
-            return self._parse_init(args[1:])
-        elif command == "code":
-            return self._parse_code(args[1:])
-        elif command == "status":
-            return self._parse_status(args[1:])
-        elif command == "explain":
-            return self._parse_explain(args[1:])
-        else:
+        handler = self._dispatch.get(command)
+        if handler is None:
             raise CLIError(f"Unknown command: {command}")
+        return handler(args[1:])
     
     def _parse_init(self, args: List[str]) -> ParsedArgs:
         """Parse 'init' command arguments."""
-        parser = argparse.ArgumentParser(prog="aureus init")
-        parser.add_argument("--policy", dest="policy_path", help="Policy file path")
-        parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
-        parser.add_argument("--interactive", "-i", action="store_true", help="Interactive setup wizard")
-        parser.add_argument("--force", "-f", action="store_true", help="Overwrite existing policy")
-        
-        parsed = parser.parse_args(args)
+        parsed = _init_parser().parse_args(args)
         return ParsedArgs(
             command="init",
             policy_path=parsed.policy_path,
@@ -232,39 +304,13 @@ class CLIParser:
         if len(args) == 0:
             raise CLIError("'code' command requires an intent argument")
         
-        # Extract intent (all non-option arguments)
-        intent_parts = []
-        remaining = []
-        skip_next = False
-        
-        for i, arg in enumerate(args):
-            if skip_next:
-                skip_next = False
-                continue
-            if arg.startswith("-"):
-                remaining.append(arg)
-                # Check if next arg is the value for this option
-                if i + 1 < len(args) and not args[i + 1].startswith("-"):
-                    remaining.append(args[i + 1])
-                    skip_next = True
-            else:
-                if not skip_next:
-                    intent_parts.append(arg)
-        
-        if not intent_parts:
+        # Options and intent words may be interleaved; the intent is every positional word
+        parsed = _code_parser().parse_intermixed_args(args)
+        if not parsed.intent:
             raise CLIError("'code' command requires an intent argument")
         
-        intent = " ".join(intent_parts)
-        
-        # Parse options
-        parser = argparse.ArgumentParser(prog="aureus code")
-        parser.add_argument("--policy", dest="policy_path", help="Policy file path")
-        parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output with full error traces")
-        parser.add_argument("--dry-run", action="store_true", help="Preview changes without writing files")
-        parser.add_argument("--stream", action="store_true", default=True, help="Stream output in real-time (default: ON)")
-        parser.add_argument("--no-stream", dest="stream", action="store_false", help="Disable streaming for clean logs")
+        intent = " ".join(parsed.intent)
         
-        parsed = parser.parse_args(remaining)
         return ParsedArgs(
             command="code",
             intent=intent,
@@ -276,11 +322,7 @@ class CLIParser:
     
     def _parse_status(self, args: List[str]) -> ParsedArgs:
         """Parse 'status' command arguments."""
-        parser = argparse.ArgumentParser(prog="aureus status")
-        parser.add_argument("--policy", dest="policy_path", help="Policy file path")
-        parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
-
-        parsed = parser.parse_args(args)
+        parsed = _status_parser().parse_args(args)
         return ParsedArgs(
             command="status",
             policy_path=parsed.policy_path,
@@ -289,19 +331,7 @@ class CLIParser:
 
     def _parse_budget(self, args: List[str]) -> ParsedArgs:
         """Parse 'budget' command arguments."""
-        parser = argparse.ArgumentParser(
-            prog="aureus budget",
-            description="Show project budget usage dashboard",
-        )
-        parser.add_argument("--policy", dest="policy_path", help="Policy file path")
-        parser.add_argument("--verbose", "-v", action="store_true",
-                            help="Show per-session build history")
-        parser.add_argument("--no-color", dest="no_color", action="store_true",
-                            help="Disable ANSI color codes (for plain-text logs)")
-        parser.add_argument("--reset", action="store_true",
-                            help="Reset all budget counters (keeps policy limits)")
-
-        parsed = parser.parse_args(args)
+        parsed = _budget_parser().parse_args(args)
         return ParsedArgs(
             command="budget",
             policy_path=parsed.policy_path,
@@ -370,24 +400,29 @@ class CLIFormatter:
         Returns:
             Formatted table string
         """
-        # Calculate column widths
-        col_widths = [len(h) for h in headers]
-        for row in rows:
-            for i, cell in enumerate(row):
-                col_widths[i] = max(col_widths[i], len(str(cell)))
+        # Stringify each cell once; widths come from one max() per column
+        str_rows = [[str(cell) for cell in row] for row in rows]
+        col_widths = [max(map(len, column)) for column in zip_longest(headers, *str_rows, fillvalue="")]
+        
+        # One format template pads a full row in a single call
+        row_format = " | ".join(f"{{:<{width}}}" for width in col_widths).format
+        
+        def format_row(cells: List[str]) -> str:
+            if len(cells) == len(col_widths):
+                return row_format(*cells)
+            # Short rows only get as many columns as they have cells
+            return " | ".join(cell.ljust(col_widths[i]) for i, cell in enumerate(cells))
         
         # Build table
         lines = []
         
         # Header
-        header_line = " | ".join(h.ljust(col_widths[i]) for i, h in enumerate(headers))
+        header_line = format_row(headers)
         lines.append(header_line)
         lines.append("-" * len(header_line))
         
         # Rows
-        for row in rows:
-            row_line = " | ".join(str(cell).ljust(col_widths[i]) for i, cell in enumerate(row))
-            lines.append(row_line)
+        lines.extend(format_row(row) for row in str_rows)
         
         return "\n".join(lines)
 
@@ -396,6 +431,31 @@ class CLIFormatter:
 # Command Implementations
 # ============================================================================
 
+def _load_policy(loader: Any, policy_path: Path) -> Any:
+    """
+    Load the project policy for a command.
+    
+    The loader stats the file itself, so callers skip a separate existence
+    check; the path is only re-checked to explain a failed load.
+    
+    Args:
+        loader: PolicyLoader to load with
+        policy_path: Policy file path
+    
+    Returns:
+        Loaded policy
+    
+    Raises:
+        CLIError: If the policy is missing or invalid
+    """
+    try:
+        return loader.load(policy_path)
+    except _lazy("PolicyLoadError") as e:
+        if not policy_path.exists():
+            raise CLIError(f"Policy file not found: {policy_path}. Run 'aureus init' first.")
+        raise CLIError(f"Failed to load policy: {e}")
+
+
 class InitCommand(BaseCommand):
     """Initialize AUREUS project with default policy."""
     
@@ -409,7 +469,7 @@ class InitCommand(BaseCommand):
         super().__init__(project_root=project_root, verbose=verbose, dry_run=False)
         self.policy_path = policy_path or (self.project_root / ".aureus/policy.yaml")
         self.interactive = interactive
-        self.loader = PolicyLoader()
+        self.loader = _lazy("PolicyLoader")()
     
     def execute(self, args: Optional[argparse.Namespace] = None) -> Dict[str, Any]:
         """
@@ -453,14 +513,14 @@ class InitCommand(BaseCommand):
             }
         
         # Non-interactive mode: create default policy
-        budget = Budget(
+        budget = _lazy("Budget")(
             max_loc=10000,
             max_modules=8,
             max_files=30,
             max_dependencies=20
         )
         
-        policy = Policy(
+        policy = _lazy("Policy")(
             version="1.0",
             project_name=Path.cwd().name,
             project_root=Path.cwd(),
@@ -506,7 +566,7 @@ class CodeCommand(BaseCommand):
         self.intent = intent
         self.policy_path = policy_path or (self.project_root / ".aureus/policy.yaml")
         self.stream = stream
-        self.loader = PolicyLoader()
+        self.loader = _lazy("PolicyLoader")()
     
     def execute(self, args: Optional[argparse.Namespace] = None) -> Dict[str, Any]:
         """
@@ -532,7 +592,7 @@ class CodeCommand(BaseCommand):
             self._dry_run_print("Code generation - no files will be modified")
             print("🔍 DRY-RUN MODE: No files will be modified\n")
         
-        self._validate_file_exists(self.policy_path)
+        # A missing policy surfaces from the load itself, without a separate stat
         self._verbose_print(f"Loading policy from {self.policy_path}")
         
         return self._handle_execution(
@@ -543,10 +603,7 @@ class CodeCommand(BaseCommand):
     def _execute_build(self) -> Dict[str, Any]:
         """Execute the actual build"""
         # Load policy
-        try:
-            policy = self.loader.load(self.policy_path)
-        except PolicyLoadError as e:
-            raise CLIError(f"Failed to load policy: {e}")
+        policy = _load_policy(self.loader, self.policy_path)
         
         # Implement full IntentParser -> Planner -> Generator pipeline
         try:
@@ -663,7 +720,7 @@ class CodeCommand(BaseCommand):
             # Show execution log for debugging
             if self.verbose or not result.success:
                 print("\n📋 Execution Log:")
-                for entry in builder.execution_log:
+                for entry in builder.get_execution_log():
                     print(f"  - {entry}")
 
             # Show detailed error trace in verbose mode
@@ -739,7 +796,7 @@ class StatusCommand(BaseCommand):
     ):
         super().__init__(project_root=project_root, verbose=verbose, dry_run=False)
         self.policy_path = policy_path or (self.project_root / ".aureus/policy.yaml")
-        self.loader = PolicyLoader()
+        self.loader = _lazy("PolicyLoader")()
 
     def execute(self, args: Optional[argparse.Namespace] = None) -> Dict[str, Any]:
         """
@@ -751,7 +808,6 @@ class StatusCommand(BaseCommand):
         Returns:
             Result dictionary with budget info
         """
-        self._validate_file_exists(self.policy_path)
         self._verbose_print(f"Loading policy from {self.policy_path}")
         
         return self._handle_execution(
@@ -762,10 +818,7 @@ class StatusCommand(BaseCommand):
     def _show_status(self) -> Dict[str, Any]:
         """Show project status"""
         # Load policy
-        try:
-            policy = self.loader.load(self.policy_path)
-        except PolicyLoadError as e:
-            raise CLIError(f"Failed to load policy: {e}")
+        policy = _load_policy(self.loader, self.policy_path)
 
         # Print budget dashboard inline
         try:
@@ -810,7 +863,7 @@ class BudgetCommand(BaseCommand):
         self.policy_path = policy_path or (self.project_root / ".aureus/policy.yaml")
         self.use_color = use_color
         self.reset = reset
-        self.loader = PolicyLoader()
+        self.loader = _lazy("PolicyLoader")()
 
     def execute(self, args: Optional[argparse.Namespace] = None) -> Dict[str, Any]:
         """Execute budget command."""
@@ -827,11 +880,10 @@ class BudgetCommand(BaseCommand):
 
         # Load policy (optional — dashboard has safe defaults)
         policy = None
-        if self.policy_path.exists():
-            try:
-                policy = self.loader.load(self.policy_path)
-            except PolicyLoadError:
-                pass
+        try:
+            policy = self.loader.load(self.policy_path)
+        except _lazy("PolicyLoadError"):
+            pass  # Missing or invalid policy
 
         dashboard = BudgetDashboard(self.project_root, policy)
 
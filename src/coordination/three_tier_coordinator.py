@@ -23,6 +23,10 @@ from src.governance.intent_parser import SpecificationGenerator
 from src.governance.planner import PricingKernel
 from src.memory.global_value_function import GlobalValueMemory, GoalType
 
+# Keyword extraction for workspace file matching
+_KEYWORD_RE = re.compile(r'\b\w{4,}\b')
+_GENERIC_VERBS = frozenset({'create', 'build', 'make', 'implement'})
+
 
 @dataclass
 class IntentGoals:
@@ -287,8 +291,8 @@ class ClaudeCodeLoop:
     def _extract_keywords(self, intent: str) -> List[str]:
         """Extract keywords from intent for file matching"""
         # Simple word extraction
-        words = re.findall(r'\b\w{4,}\b', intent.lower())
-        return [w for w in words if w not in ['create', 'build', 'make', 'implement']]
+        words = _KEYWORD_RE.findall(intent.lower())
+        return [w for w in words if w not in _GENERIC_VERBS]
 
 
 class ThreeTierCoordinator:
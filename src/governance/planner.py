@@ -15,7 +15,9 @@ Planner performs:
 Like a compiler optimizer, Planner minimizes complexity cost while ensuring constraints.
 """
 
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from typing import List, Dict, Any
 from src.interfaces import Specification, Cost, Budget, Policy
 
@@ -346,8 +348,16 @@ class PricingKernel:
     
     Calculates complexity cost, enforces budgets, generates alternatives
     Integrates risk assessment from IntentParser for security cost adjustment
+    
+    Prices are memoized process-wide (LRU) so repeated specifications are
+    not re-priced across kernel instances.
     """
     
+    CACHE_SIZE = 256
+    _price_cache: "OrderedDict[tuple, Cost]" = OrderedDict()
+    # Concurrent builds price through the shared cache; guards its reorders and evictions
+    _price_cache_lock = threading.Lock()
+    
     def __init__(self):
         self.cost_model = LinearCostModel()
         self.budget_enforcer = BudgetEnforcer()
@@ -361,6 +371,39 @@ class PricingKernel:
         
         Returns Cost object with budget status and alternatives if needed
         """
+        key = (spec.cache_key(), policy.budgets.max_loc, self._config_key())
+        cache = PricingKernel._price_cache
+        with PricingKernel._price_cache_lock:
+            cost = cache.get(key)
+            if cost is not None:
+                cache.move_to_end(key)
+        
+        if cost is None:
+            # Priced outside the lock; a racing thread computes the same Cost
+            cost = self._price(spec, policy)
+            with PricingKernel._price_cache_lock:
+                cache[key] = cost
+                if len(cache) > self.CACHE_SIZE:
+                    cache.popitem(last=False)
+        
+        # Hand out a copy so callers cannot mutate the cached alternatives
+        return replace(cost, alternatives=list(cost.alternatives))
+    
+    def _config_key(self) -> tuple:
+        """Cost-model weights and thresholds that affect pricing"""
+        model = self.cost_model
+        enforcer = self.budget_enforcer
+        return (
+            model.loc_weight,
+            model.dependency_weight,
+            model.abstraction_weight,
+            enforcer.advisory_threshold,
+            enforcer.warning_threshold,
+            enforcer.rejection_threshold
+        )
+    
+    def _price(self, spec: Specification, policy: Policy) -> Cost:
+        """Compute cost for a specification (uncached)"""
         # Extract estimates from specification budget
         estimated_loc = spec.budgets.max_loc_delta
         estimated_dependencies = spec.budgets.max_new_dependencies
@@ -8,11 +8,22 @@ Handles:
 - Error reporting with context
 """
 
+import copy
 import yaml
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from src.interfaces import Policy, Budget, ForbiddenPattern, ValidationError
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Parsed policy documents keyed by resolved path -> ((mtime_ns, size), data)
+_POLICY_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
 
 class PolicyLoadError(Exception):
     """Raised when policy loading fails."""
@@ -120,13 +131,49 @@ class PolicyLoader:
             PolicyLoadError: If loading or validation fails
         """
         # Check file exists
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             raise PolicyLoadError(f"Policy file not found: {path}")
+        except OSError as e:
+            raise PolicyLoadError(f"Failed to read file: {e}")
+        
+        # Reuse the parsed document while the file is unchanged
+        cache_key = str(path.resolve())
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = _POLICY_CACHE.get(cache_key)
+        if cached is not None and cached[0] == version:
+            data = copy.deepcopy(cached[1])
+        else:
+            data = self._parse(path)
+            _POLICY_CACHE[cache_key] = (version, copy.deepcopy(data))
+        
+        # Convert to Policy object
+        try:
+            policy = self._dict_to_policy(data)
+        except ValidationError as e:
+            raise PolicyLoadError(f"Policy validation error: {e}")
+        except Exception as e:
+            raise PolicyLoadError(f"Failed to create Policy object: {e}")
+        
+        return policy
+    
+    def _parse(self, path: Path) -> Dict[str, Any]:
+        """
+        Parse and validate policy YAML.
         
-        # Parse YAML
+        Args:
+            path: Path to policy YAML file
+        
+        Returns:
+            Validated policy dictionary
+        
+        Raises:
+            PolicyLoadError: If parsing or validation fails
+        """
         try:
             with open(path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
         except yaml.YAMLError as e:
             raise PolicyLoadError(f"Invalid YAML syntax: {e}")
         except Exception as e:
@@ -141,15 +188,7 @@ class PolicyLoader:
             error_msg = "Policy validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
             raise PolicyLoadError(error_msg)
         
-        # Convert to Policy object
-        try:
-            policy = self._dict_to_policy(data)
-        except ValidationError as e:
-            raise PolicyLoadError(f"Policy validation error: {e}")
-        except Exception as e:
-            raise PolicyLoadError(f"Failed to create Policy object: {e}")
-        
-        return policy
+        return data
     
     def save(self, policy: Policy, path: Path) -> None:
         """
@@ -19,6 +19,12 @@ from pathlib import Path
 from src.interfaces import Policy, Specification
 
 
+# Fallback change planned when decomposition yields no subtasks or fails
+_FALLBACK_PATH = "src/implementation.py"
+_FALLBACK_TEMPLATE = "# Implementation for: {intent}\n"
+_FALLBACK_ERROR_TEMPLATE = _FALLBACK_TEMPLATE + "# Error in planning: {error}\n"
+
+
 class LoopPhase(Enum):
     """Agentic loop phases"""
     GATHER = "gather"
@@ -404,8 +410,8 @@ class AgenticLoop:
             if not changes:
                 changes.append({
                     "type": "file_create",
-                    "path": "src/implementation.py",
-                    "content": f"# Implementation for: {spec.intent}\n",
+                    "path": _FALLBACK_PATH,
+                    "content": _FALLBACK_TEMPLATE.format(intent=spec.intent),
                     "estimated_loc": 10
                 })
         
@@ -413,8 +419,8 @@ class AgenticLoop:
             # Fallback to simple planning
             changes.append({
                 "type": "file_create",
-                "path": "src/implementation.py",
-                "content": f"# Implementation for: {spec.intent}\n# Error in planning: {str(e)}\n",
+                "path": _FALLBACK_PATH,
+                "content": _FALLBACK_ERROR_TEMPLATE.format(intent=spec.intent, error=e),
                 "estimated_loc": 10
             })
         
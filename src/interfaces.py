@@ -258,7 +258,7 @@ class Policy:
 # Specification Model (Tier 1: IntentParser Output)
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class AcceptanceTest:
     """A test case to verify specification success."""
     
@@ -359,6 +359,21 @@ class Specification:
             "estimated_cost": self.estimated_cost
         }
     
+    def cache_key(self) -> tuple:
+        """Hashable key for caching results derived from this specification."""
+        budgets = self.budgets
+        return (
+            self.intent,
+            tuple(self.success_criteria),
+            budgets.max_loc_delta,
+            budgets.max_new_files,
+            budgets.max_new_dependencies,
+            budgets.max_new_abstractions,
+            budgets.max_cyclomatic_complexity,
+            self.risk_level,
+            tuple(d.name for d in self.dependencies_needed)
+        )
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Specification':
         """Deserialize from dictionary."""
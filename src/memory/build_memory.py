@@ -6,6 +6,8 @@ Part of the continuous intelligence improvement loop.
 """
 
 import json
+import os
+import threading
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
@@ -54,6 +56,9 @@ class BuildMemory:
         """
         self.memory_file = memory_file or Path(".aureus") / "build_memory.json"
         self.entries: List[BuildMemoryEntry] = []
+        
+        # Builders running concurrently share one instance; records and saves are serialized
+        self._lock = threading.Lock()
         self._load()
     
     def _load(self):
@@ -71,12 +76,15 @@ class BuildMemory:
         """Save memory to disk"""
         try:
             self.memory_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.memory_file, 'w') as f:
+            # Write a temp file and swap it in so readers never see a partial file
+            tmp_file = self.memory_file.with_name(f"{self.memory_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_file, 'w') as f:
                 json.dump({
                     "version": "1.0",
                     "last_updated": datetime.now().isoformat(),
                     "entries": [e.to_dict() for e in self.entries]
                 }, f, indent=2)
+            os.replace(tmp_file, self.memory_file)
         except Exception as e:
             print(f"Warning: Could not save memory: {e}")
     
@@ -117,8 +125,9 @@ class BuildMemory:
             resolution=resolution
         )
         
-        self.entries.append(entry)
-        self._save()
+        with self._lock:
+            self.entries.append(entry)
+            self._save()
     
     def find_similar_intents(self, intent: str, limit: int = 5) -> List[BuildMemoryEntry]:
         """
@@ -65,8 +65,17 @@ class CostLedger:
         Args:
             entry: Cost entry to record
         """
-        self.entries.append(entry)
-        # Auto-save after each entry
+        self.record_many([entry])
+    
+    def record_many(self, entries: List[CostEntry]):
+        """
+        Record several cost entries with a single save
+        
+        Args:
+            entries: Cost entries to record, in order
+        """
+        self.entries.extend(entries)
+        # Auto-save after each batch
         self.save()
     
     def get_total_cost(self) -> float:
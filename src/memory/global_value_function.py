@@ -12,6 +12,8 @@ Key concepts:
 """
 
 import json
+import os
+import threading
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from pathlib import Path
@@ -277,6 +279,9 @@ class GlobalValueMemory:
         self.agent_vfs: Dict[str, LocalValueFunction] = {}
         self.alignment_history: List[Dict[str, Any]] = []
         self.drift_events: List[Dict[str, Any]] = []
+        
+        # Builders running concurrently share one instance; updates and saves are serialized
+        self._lock = threading.Lock()
         self._load()
     
     def _load(self):
@@ -348,7 +353,9 @@ class GlobalValueMemory:
         """Save global value function and history"""
         try:
             self.memory_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.memory_file, 'w') as f:
+            # Write a temp file and swap it in so readers never see a partial file
+            tmp_file = self.memory_file.with_name(f"{self.memory_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_file, 'w') as f:
                 json.dump({
                     "version": "1.0",
                     "last_updated": datetime.now().isoformat(),
@@ -356,6 +363,7 @@ class GlobalValueMemory:
                     "alignment_history": self.alignment_history[-100:],  # Keep last 100
                     "drift_events": self.drift_events[-50:]  # Keep last 50
                 }, f, indent=2)
+            os.replace(tmp_file, self.memory_file)
         except Exception as e:
             print(f"Warning: Could not save global value memory: {e}")
     
@@ -391,27 +399,28 @@ class GlobalValueMemory:
             self.global_vf, state, action
         )
         
-        # Record alignment
-        self.alignment_history.append({
-            "timestamp": datetime.now().isoformat(),
-            "agent_id": agent_id,
-            "action": action.get("type", "unknown"),
-            "aligned": aligned,
-            "alignment_score": alignment_score,
-            "warnings": warnings
-        })
-        
-        # Detect drift
-        if alignment_score < 0.5:
-            self.drift_events.append({
+        with self._lock:
+            # Record alignment
+            self.alignment_history.append({
                 "timestamp": datetime.now().isoformat(),
                 "agent_id": agent_id,
+                "action": action.get("type", "unknown"),
+                "aligned": aligned,
                 "alignment_score": alignment_score,
                 "warnings": warnings
             })
-            warnings.insert(0, f"⚠️ DRIFT DETECTED: Alignment score {alignment_score:.2f} < 0.5")
-        
-        self._save()
+            
+            # Detect drift
+            if alignment_score < 0.5:
+                self.drift_events.append({
+                    "timestamp": datetime.now().isoformat(),
+                    "agent_id": agent_id,
+                    "alignment_score": alignment_score,
+                    "warnings": warnings
+                })
+                warnings.insert(0, f"⚠️ DRIFT DETECTED: Alignment score {alignment_score:.2f} < 0.5")
+            
+            self._save()
         
         return aligned, warnings
     
@@ -426,12 +435,13 @@ class GlobalValueMemory:
         if not self.global_vf:
             return
         
-        for goal in self.global_vf.goals:
-            if goal.goal_type == goal_type:
-                goal.weight = weight
-                self.global_vf.updated_at = datetime.now().isoformat()
-                self._save()
-                break
+        with self._lock:
+            for goal in self.global_vf.goals:
+                if goal.goal_type == goal_type:
+                    goal.weight = weight
+                    self.global_vf.updated_at = datetime.now().isoformat()
+                    self._save()
+                    break
     
     def get_alignment_statistics(self) -> Dict[str, Any]:
         """Get alignment statistics"""
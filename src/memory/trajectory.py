@@ -8,11 +8,15 @@ Enables learning from past sessions and context building.
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import json
 import uuid
 
 
+# Keys every session file has (the storage directory also holds other JSON files)
+_SESSION_KEYS = frozenset({'session_id', 'intent', 'start_time'})
+
+
 @dataclass
 class ActionRecord:
     """Single action in a trajectory"""
@@ -97,6 +101,9 @@ class TrajectoryStore:
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self._active_sessions: Dict[str, SessionTrajectory] = {}
+        
+        # Parsed session files keyed by path -> ((mtime_ns, size), session)
+        self._session_cache: Dict[Path, Tuple[Tuple[int, int], Optional[SessionTrajectory]]] = {}
     
     def start_session(self, intent: str) -> SessionTrajectory:
         """
@@ -126,6 +133,16 @@ class TrajectoryStore:
             session_id: Session identifier
             action: Action to record
         """
+        self.record_actions(session_id, [action])
+    
+    def record_actions(self, session_id: str, actions: List[ActionRecord]):
+        """
+        Record several actions in the trajectory with a single save
+        
+        Args:
+            session_id: Session identifier
+            actions: Actions to record, in order
+        """
         if session_id not in self._active_sessions:
             # Try to load from disk
             session = self.get_session(session_id)
@@ -133,9 +150,9 @@ class TrajectoryStore:
                 raise ValueError(f"Session {session_id} not found")
             self._active_sessions[session_id] = session
         
-        self._active_sessions[session_id].actions.append(action)
+        self._active_sessions[session_id].actions.extend(actions)
         
-        # Auto-save after each action
+        # Auto-save after each batch
         self._save_session(session_id)
     
     def end_session(
@@ -200,34 +217,96 @@ class TrajectoryStore:
         """
         List all stored sessions
         
+        Session files are parsed once and reused until their mtime or size
+        changes, so returned trajectories should be treated as read-only.
+        
         Args:
             limit: Maximum number of sessions to return (most recent first)
             
         Returns:
             List of session trajectories
         """
-        session_files = sorted(
-            self.storage_dir.glob("*.json"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True
-        )
+        session_files = []
+        for session_file in self.storage_dir.glob("*.json"):
+            try:
+                session_files.append((session_file.stat(), session_file))
+            except OSError:
+                continue
+        
+        # Forget files that no longer exist
+        present = {session_file for _, session_file in session_files}
+        for stale in self._session_cache.keys() - present:
+            del self._session_cache[stale]
+        
+        session_files.sort(key=lambda entry: entry[0].st_mtime, reverse=True)
         
         if limit:
             session_files = session_files[:limit]
         
         sessions = []
-        for session_file in session_files:
+        for stat, session_file in session_files:
+            key = (stat.st_mtime_ns, stat.st_size)
+            cached = self._session_cache.get(session_file)
+            if cached is not None and cached[0] == key:
+                session = cached[1]
+            else:
+                session = self._load_session_file(session_file)
+                self._session_cache[session_file] = (key, session)
+            if session is not None:
+                sessions.append(session)
+        
+        return sessions
+    
+    def session_summaries(self) -> List[Tuple[bool, float, int]]:
+        """
+        Summarize stored sessions without building their trajectories
+        
+        Unchanged files reuse sessions already parsed by list_sessions; other
+        files are read as plain JSON, skipping action and timestamp parsing.
+        
+        Returns:
+            (success, total_cost, action count) per session, in no particular order
+        """
+        summaries = []
+        for session_file in self.storage_dir.glob("*.json"):
+            try:
+                stat = session_file.stat()
+            except OSError:
+                continue
+            
+            cached = self._session_cache.get(session_file)
+            if cached is not None and cached[0] == (stat.st_mtime_ns, stat.st_size):
+                session = cached[1]
+                if session is not None:
+                    summaries.append((session.success, session.total_cost, len(session.actions)))
+                continue
+            
             try:
                 with open(session_file, 'r') as f:
                     data = json.load(f)
-                # Ensure data is a dict, not a list
-                if isinstance(data, dict):
-                    sessions.append(SessionTrajectory.from_dict(data))
-            except (json.JSONDecodeError, TypeError, KeyError) as e:
-                # Skip malformed session files
+            except (OSError, json.JSONDecodeError):
                 continue
+            if isinstance(data, dict) and _SESSION_KEYS <= data.keys():
+                summaries.append((
+                    data.get('success', False),
+                    data.get('total_cost', 0.0),
+                    len(data.get('actions', []))
+                ))
         
-        return sessions
+        return summaries
+    
+    def _load_session_file(self, session_file: Path) -> Optional[SessionTrajectory]:
+        """Parse a session file, or None if it is not a session trajectory"""
+        try:
+            with open(session_file, 'r') as f:
+                data = json.load(f)
+            # Ensure data is a dict, not a list
+            if isinstance(data, dict):
+                return SessionTrajectory.from_dict(data)
+        except (json.JSONDecodeError, TypeError, KeyError):
+            # Skip malformed session files
+            pass
+        return None
     
     def _save_session(self, session_id: str):
         """Save session to disk"""
@@ -9,6 +9,7 @@ Improvements:
 """
 
 from typing import Iterator, Optional, Callable
+import functools
 import time
 import re
 from dataclasses import dataclass
@@ -23,6 +24,17 @@ class TokenCountEstimate:
     accurate: bool  # True if using tiktoken
 
 
+@functools.lru_cache(maxsize=4)
+def _get_encoding(model: str):
+    """Load the tiktoken encoding for a model once per process (None if unavailable)"""
+    try:
+        import tiktoken
+        return tiktoken.encoding_for_model(model)
+    except (ImportError, KeyError):
+        # tiktoken not available or model not supported
+        return None
+
+
 class EnhancedTokenCounter:
     """
     Enhanced token counting with tiktoken support
@@ -32,17 +44,10 @@ class EnhancedTokenCounter:
     
     def __init__(self, model: str = "gpt-4"):
         self.model = model
-        self._tiktoken_available = False
-        self._encoding = None
         
-        # Try to import tiktoken
-        try:
-            import tiktoken
-            self._encoding = tiktoken.encoding_for_model(model)
-            self._tiktoken_available = True
-        except (ImportError, KeyError):
-            # tiktoken not available or model not supported
-            pass
+        # Encodings are shared across counters, so providers are cheap to construct
+        self._encoding = _get_encoding(model)
+        self._tiktoken_available = self._encoding is not None
     
     def count_tokens(self, text: str) -> TokenCountEstimate:
         """
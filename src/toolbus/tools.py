@@ -239,14 +239,16 @@ class FileWriteTool(BaseTool):
             # Create parent directories
             path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Write content
+            # Write content (text mode keeps platform newline translation)
             path.write_text(content, encoding="utf-8")
             
+            # UTF-8 size of the content, before any newline translation
+            size_bytes = len(content.encode("utf-8"))
             return self._success(
-                output=f"Successfully wrote {len(content)} bytes",
+                output=f"Successfully wrote {size_bytes} bytes",
                 file_path=str(path),
                 backup_path=str(backup_path) if backup_path else None,
-                size_bytes=len(content)
+                size_bytes=size_bytes
             )
         
         except PermissionError as e:
@@ -0,0 +1,12 @@
+"""
+Shared test fixtures
+"""
+
+import pytest
+
+
+@pytest.fixture
+def isolated_cwd(tmp_path, monkeypatch):
+    """Run in a temporary directory so runtime state under .aureus/ stays out of the repo"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
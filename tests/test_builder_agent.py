@@ -14,6 +14,10 @@ from src.agents import BuilderAgent, AgentOrchestrator, BuildResult
 from src.model_provider import MockProvider
 
 
+# Builds persist build and global value memory under the working directory
+pytestmark = pytest.mark.usefixtures("isolated_cwd")
+
+
 @pytest.fixture
 def temp_project(tmp_path):
     """Create temporary project directory"""
@@ -180,6 +184,328 @@ class TestBuilderAgent:
         assert any("Generating specification" in entry["message"] for entry in log)
         assert any("Calculating cost" in entry["message"] for entry in log)
     
+    def test_execution_log_serializes_entries(self, builder_agent):
+        """Test log entries are exposed as dicts and feed validation errors"""
+        builder_agent._log("Step one", detail=1)
+        builder_agent._log("Acceptance test failed", error="boom", stderr="trace")
+
+        log = builder_agent.get_execution_log()
+        assert log[-2] == {"message": "Step one", "detail": 1}
+        assert log[-1]["error"] == "boom"
+        assert builder_agent._extract_validation_error() == "boom\nStderr: trace"
+        
+        # Later entries without an error keep pointing at the last error
+        for i in range(BuilderAgent.MAX_LOG_ENTRIES + 1):
+            builder_agent._log("Step", index=i)
+        builder_agent._log("Import failed", error="late")
+        builder_agent._log("Step two")
+        assert builder_agent._extract_validation_error() == "late"
+
+    def test_execution_log_is_bounded(self, builder_agent):
+        """Test only the most recent log entries are retained"""
+        limit = BuilderAgent.MAX_LOG_ENTRIES
+        for i in range(limit + 10):
+            builder_agent._log("Step", index=i)
+        
+        log = builder_agent.get_execution_log()
+        assert len(log) == limit
+        assert log[0]["index"] == 10
+        assert log[-1]["index"] == limit + 9
+    
+    def test_validate_implementation_checks_syntax_and_imports(self, builder_agent, temp_project):
+        """Test validation parses each file once and resolves its imports"""
+        from src.interfaces import Specification, SpecificationBudget
+        
+        spec = Specification(
+            intent="test",
+            success_criteria=["Works"],
+            budgets=SpecificationBudget(max_loc_delta=10, max_new_files=1, max_new_dependencies=0),
+            risk_level="low"
+        )
+        good = temp_project / "good_module.py"
+        good.write_text("import os.path\nimport os\nfrom json import dumps\n\nVALUE = dumps(os.path.sep)\n")
+        relative = temp_project / "relative_module.py"
+        relative.write_text("from . import sibling\nfrom .helpers import tool\nimport re\n")
+        bad_syntax = temp_project / "bad_syntax.py"
+        bad_syntax.write_text("def broken(:\n")
+        bad_import = temp_project / "bad_import.py"
+        bad_import.write_text("import definitely_not_a_module_xyz\n")
+        
+        assert builder_agent._parse_and_validate(str(good)) == (True, ["os", "json"])
+        assert builder_agent._parse_and_validate(str(relative)) == (True, ["re"])
+        
+        latin1 = temp_project / "latin1_module.py"
+        latin1.write_bytes("# -*- coding: latin-1 -*-\nNAME = 'caf\xe9'\nimport json\n".encode("latin-1"))
+        assert builder_agent._parse_and_validate(str(latin1)) == (True, ["json"])
+        assert builder_agent._validate_implementation(spec, [str(good)]) is True
+        assert builder_agent._validate_implementation(spec, [str(bad_syntax)]) is False
+        assert builder_agent._validate_implementation(spec, [str(bad_import)]) is False
+        
+        # A failing file stops validation before later files are read
+        builder_agent.execution_log.clear()
+        assert builder_agent._validate_implementation(spec, [str(bad_import), str(good)]) is False
+        checked = [e["file"] for e in builder_agent.get_execution_log() if e["message"] == "Syntax check passed"]
+        assert checked == [str(bad_import)]
+    
+    def test_acceptance_tests_run_in_one_batch(self, builder_agent, temp_project):
+        """Test acceptance tests share one subprocess and stop at the first failure"""
+        from src.interfaces import Specification, SpecificationBudget, AcceptanceTest
+        
+        spec = Specification(
+            intent="test",
+            success_criteria=["Works"],
+            budgets=SpecificationBudget(max_loc_delta=10, max_new_files=1, max_new_dependencies=0),
+            risk_level="low",
+            acceptance_tests=[
+                AcceptanceTest(name="test_first", description="First"),
+                AcceptanceTest(name="test_second", description="Second")
+            ]
+        )
+        good = temp_project / "batch_good.py"
+        good.write_text("VALUE = 1\n")
+        bad = temp_project / "batch_bad.py"
+        bad.write_text("raise RuntimeError('boom on import')\n")
+        
+        assert builder_agent._run_acceptance_tests(spec, [str(good)]) is True
+        passed = [e["test_name"] for e in builder_agent.get_execution_log()
+                  if e["message"] == "Acceptance test passed"]
+        assert passed == ["test_first", "test_second"]
+        
+        builder_agent.execution_log.clear()
+        assert builder_agent._run_acceptance_tests(spec, [str(bad)]) is False
+        failed = [e for e in builder_agent.get_execution_log() if e["message"] == "Acceptance test failed"]
+        assert [e["test_name"] for e in failed] == ["test_first"]
+        assert "boom on import" in failed[0]["stdout"]
+    
+    def test_acceptance_test_code_reused_across_retries(self, builder_agent, temp_project):
+        """Test the import snippet for a generated file is built once"""
+        from src.interfaces import AcceptanceTest
+        
+        test = AcceptanceTest(name="test_import", description="Imports")
+        target = str(temp_project / "retry_module.py")
+        
+        code = builder_agent._generate_test_code(test, [target])
+        assert "import retry_module" in code
+        assert f"sys.path.insert(0, '{temp_project}')" in code
+        assert builder_agent._generate_test_code(test, [target]) is code
+        assert builder_agent._generate_test_code(test, []) == ""
+    
+    def test_basic_functionality_checks_files_concurrently(self, builder_agent, temp_project):
+        """Test import checks report the first failing file in order"""
+        files = []
+        for name in ("mod_a", "mod_b", "mod_c"):
+            path = temp_project / f"{name}.py"
+            path.write_text("VALUE = 1\n")
+            files.append(str(path))
+        
+        assert builder_agent._verify_basic_functionality(files) is True
+        
+        (temp_project / "mod_b.py").write_text("raise ValueError('bad module')\n")
+        (temp_project / "mod_c.py").write_text("raise ValueError('also bad')\n")
+        assert builder_agent._verify_basic_functionality(files) is False
+        
+        failure = builder_agent.get_execution_log()[-1]
+        assert failure["message"] == "Basic functionality check failed"
+        assert failure["file"] == files[1]
+        assert "bad module" in failure["error"]
+    
+    def test_import_check_runs_outside_agent_process(self, builder_agent, temp_project):
+        """Test generated modules are imported in a fresh interpreter only"""
+        import builtins
+        
+        path = temp_project / "gen_side_effect.py"
+        path.write_text("import builtins\nbuiltins.AUREUS_IMPORT_MARK = 1\n")
+        
+        assert builder_agent._import_check(str(path)) == (str(path), True, "Import successful\n")
+        assert not hasattr(builtins, "AUREUS_IMPORT_MARK")
+        
+        broken = temp_project / "gen_broken.py"
+        broken.write_text("raise RuntimeError('boom')\n")
+        _, ok, output = builder_agent._import_check(str(broken))
+        assert ok is False
+        assert "Import failed: boom" in output
+    
+    def test_parse_results_cached_until_file_changes(self, builder_agent, temp_project, monkeypatch):
+        """Test unchanged files are not re-parsed on revalidation"""
+        import ast
+        import os
+        
+        module = temp_project / "cached_module.py"
+        module.write_text("import json\n")
+        calls = []
+        real_parse = ast.parse
+        monkeypatch.setattr(ast, "parse", lambda *a, **kw: calls.append(1) or real_parse(*a, **kw))
+        
+        assert builder_agent._parse_and_validate(str(module)) == (True, ["json"])
+        assert builder_agent._parse_and_validate(str(module)) == (True, ["json"])
+        assert len(calls) == 1
+        
+        # A new mtime invalidates the entry
+        os.utime(module, ns=(0, 10**9))
+        assert builder_agent._parse_and_validate(str(module)) == (True, ["json"])
+        assert len(calls) == 2
+        
+        # So does a new size with the mtime held fixed
+        module.write_text("import json, re\n")
+        os.utime(module, ns=(0, 10**9))
+        assert builder_agent._parse_and_validate(str(module)) == (True, ["json", "re"])
+        assert len(calls) == 3
+        
+        # The least recently used entry is evicted past IMPORT_CACHE_SIZE
+        monkeypatch.setattr(builder_agent, "IMPORT_CACHE_SIZE", 1)
+        builder_agent._import_cache.clear()
+        other = temp_project / "other_module.py"
+        other.write_text("import os\n")
+        assert builder_agent._parse_and_validate(str(module)) == (True, ["json", "re"])
+        assert builder_agent._parse_and_validate(str(other)) == (True, ["os"])
+        assert [key[0] for key in builder_agent._import_cache] == [str(other)]
+        assert builder_agent._parse_and_validate(str(module)) == (True, ["json", "re"])
+        assert len(calls) == 6
+    
+    def test_import_lookups_are_memoized(self):
+        """Test find_spec results are cached until explicitly cleared"""
+        from src.agents.builder import _module_available, clear_validation_caches
+        
+        clear_validation_caches()
+        assert _module_available("pytest") is True
+        assert _module_available("definitely_not_a_module_xyz") is False
+        assert _module_available("pytest") is True
+        assert _module_available.cache_info().hits == 1
+        
+        clear_validation_caches()
+        assert _module_available.cache_info().currsize == 0
+    
+    def test_py_file_index_refreshes_after_writes(self, builder_agent, temp_project):
+        """Test the cached Python file index is rebuilt only when marked dirty"""
+        (temp_project / "pkg").mkdir()
+        (temp_project / "pkg" / "a.py").write_text("A = 1\n")
+        
+        files = builder_agent._get_py_files()
+        assert temp_project / "pkg" / "a.py" in files
+        
+        (temp_project / "b.py").write_text("B = 1\n")
+        assert builder_agent._get_py_files() is files
+        
+        builder_agent._py_files_dirty = True
+        assert temp_project / "b.py" in builder_agent._get_py_files()
+    
+    def test_gather_context_scores_workspace_files(self, builder_agent, temp_project):
+        """Test workspace files are scored by keyword and previewed"""
+        workspace = temp_project / "workspace"
+        workspace.mkdir(exist_ok=True)
+        (workspace / "calculator.py").write_text('"""Calculator Helpers"""\n' + "x = 'é'\n" * 100)
+        (workspace / "unrelated.py").write_text("VALUE = 1\n")
+        (workspace / ".hidden.py").write_text("calculator helpers\n")
+        (workspace / "notes.txt").write_text("calculator helpers\n")
+        
+        context = builder_agent._gather_context("calculator helpers")
+        
+        # Dotfiles count, as they did with Path.glob("*.py")
+        files = {f["path"]: f for f in context["relevant_files"]}
+        assert set(files) == {str(Path("workspace", "calculator.py")), str(Path("workspace", ".hidden.py"))}
+        calculator = files[str(Path("workspace", "calculator.py"))]
+        assert calculator["score"] == 2
+        assert calculator["preview"] == (workspace / "calculator.py").read_text()[:300]
+        
+        # Non-ASCII keywords match case-insensitively too
+        (workspace / "menu.py").write_text("CAFÉ_PRICES = {}\n", encoding="utf-8")
+        files = builder_agent._gather_context("café prices")["relevant_files"]
+        assert [(f["path"], f["score"]) for f in files] == [(str(Path("workspace", "menu.py")), 2)]
+    
+    def test_intent_words_for_fallback_filename(self):
+        """Test only whitespace-delimited alphanumeric words form filenames"""
+        from src.agents.builder import _INTENT_WORD_RE
+        
+        intent = "Add REST API endpoint, for user-creation v2"
+        assert _INTENT_WORD_RE.findall(intent) == ["Add", "REST", "API", "for", "v2"]
+        assert _INTENT_WORD_RE.findall("snake_case  été") == ["été"]
+    
+    def test_tool_permissions_extracted_from_policy(self):
+        """Test nested and flat permission layouts map to booleans"""
+        from src.agents.builder import _extract_tool_permissions
+        
+        nested = {"tools": {"file_read": "allow", "file_write": "deny"}}
+        assert _extract_tool_permissions(nested) == {"file_read": True, "file_write": False}
+        
+        flat = {"file_read": "allow", "file_write": True, "network": False}
+        assert _extract_tool_permissions(flat) == {"file_read": True, "file_write": True, "network": False}
+        assert _extract_tool_permissions(None) == {}
+    
+    def test_extract_keywords_drops_short_and_stop_words(self, builder_agent):
+        """Test intent keywords skip stop words and words of 3 letters or fewer"""
+        keywords = builder_agent._extract_keywords("Create an API with JSON output for users")
+        assert keywords == ["create", "json", "output", "users"]
+    
+    def test_extract_code_patterns(self, builder_agent):
+        """Test code pattern detection keeps its reporting order"""
+        code = 'import os\n\n@cache\ndef f() -> int:\n    """Doc"""\n    raise ValueError()\n'
+        
+        assert builder_agent._extract_code_patterns(code) == [
+            "function_definition", "docstrings", "type_hints",
+            "imports", "decorators", "exception_raising"
+        ]
+        assert builder_agent._extract_code_patterns("x = 1  # @note") == []
+    
+    def test_heavy_components_load_on_first_use(self, builder_agent):
+        """Test memory and coordinator are built lazily and only once"""
+        assert "memory" not in vars(builder_agent)
+        assert "coordinator" not in vars(builder_agent)
+        
+        coordinator = builder_agent.coordinator
+        assert builder_agent.coordinator is coordinator
+        assert "builder_agent" in builder_agent.global_value_memory.agent_vfs
+        assert builder_agent.memory is builder_agent.memory
+    
+    def test_fast_write_creates_and_truncates(self, builder_agent, temp_project):
+        """Test generated files are written once per call and overwrite old content"""
+        target = temp_project / "pkg" / "nested" / "module.py"
+        
+        builder_agent._fast_write(target, "VALUE = 'é' * 100\n")
+        assert target.read_text(encoding="utf-8") == "VALUE = 'é' * 100\n"
+        assert target.parent in builder_agent._ensured_dirs
+        
+        builder_agent._py_files_dirty = False
+        builder_agent._fast_write(target, "VALUE = 1\n")
+        assert target.read_text() == "VALUE = 1\n"
+        assert builder_agent._py_files_dirty is True
+    
+    def test_cleanup_files_reports_failures(self, temp_project):
+        """Test failed-attempt cleanup ignores missing files and counts errors"""
+        from src.agents.builder import _cleanup_files
+        
+        stale = temp_project / "stale.py"
+        stale.write_text("X = 1\n")
+        directory = temp_project / "not_a_file"
+        directory.mkdir()
+        
+        paths = [str(stale), str(temp_project / "missing.py"), str(directory)]
+        assert _cleanup_files(paths) == 1
+        assert not stale.exists()
+        assert directory.exists()
+    
+    def test_llm_response_logged_only_at_debug(self, builder_agent, capsys, caplog):
+        """Test the raw LLM response is not printed unless debug logging is on"""
+        import logging
+        
+        builder_agent._legacy_build("Create a hello world function")
+        assert "LLM RESPONSE" not in capsys.readouterr().out
+        assert not any("LLM response" in r.message for r in caplog.records)
+        
+        with caplog.at_level(logging.DEBUG, logger="src.agents.builder"):
+            builder_agent._legacy_build("Create a hello world function")
+        assert any("LLM response" in r.message for r in caplog.records)
+    
+    def test_generation_context_gathered_once_per_build(self, builder_agent, monkeypatch):
+        """Test retries reuse the workspace context and memory lookup"""
+        monkeypatch.setattr(builder_agent, "_validate_implementation", lambda spec, files: False)
+        
+        result = builder_agent._legacy_build("Create a hello world function")
+        
+        log = builder_agent.get_execution_log()
+        assert result.success is False
+        assert sum(e["message"] == "Generation attempt" for e in log) == 3
+        assert sum(e["message"] == "Context gathered" for e in log) == 1
+    
     def test_build_handles_errors_gracefully(self, builder_agent):
         """Test build handles errors without crashing"""
         # Invalid intent
@@ -207,6 +533,66 @@ class TestAgentOrchestrator:
         assert isinstance(result, BuildResult)
         assert result.specification is not None
     
+    def test_orchestrator_shares_agent_context(self, orchestrator, test_policy):
+        """Test builders spawned for one policy reuse the same components"""
+        from src.agents.builder import get_agent_context
+        
+        context = get_agent_context(test_policy)
+        assert orchestrator.context is context
+        assert orchestrator.builder.file_write is context.file_write
+        assert AgentOrchestrator(test_policy).context is context
+        
+        # Standalone agents still get their own components
+        assert BuilderAgent(test_policy).context is not context
+    
+    def test_orchestrator_executes_intents_concurrently(self, orchestrator):
+        """Test orchestrator runs independent intents via asyncio"""
+        import asyncio
+        
+        intents = ["Create utility module", "Create parser module"]
+        results = asyncio.run(orchestrator.execute_many_async(intents))
+        
+        assert len(results) == 2
+        assert all(isinstance(result, BuildResult) for result in results)
+        assert [result.specification.intent for result in results] == intents
+    
+    def test_concurrent_builds_persist_every_memory_update(self, orchestrator, temp_project, monkeypatch):
+        """Test concurrent builds record into one memory without losing saves"""
+        import asyncio
+        import json
+        from src.memory.build_memory import BuildMemory
+        from src.memory.global_value_function import GlobalValueMemory
+        
+        memory_file = temp_project / ".aureus" / "build_memory.json"
+        value_file = temp_project / ".aureus" / "global_value_memory.json"
+        orchestrator.builder.memory = BuildMemory(memory_file=memory_file)
+        orchestrator.builder.global_value_memory = GlobalValueMemory(memory_file=value_file)
+        orchestrator.builder.global_value_memory.register_agent(
+            agent_id="builder_agent",
+            agent_role="unified_builder",
+            local_goals=["code_generation"]
+        )
+        
+        def record(self, intent):
+            for attempt in range(10):
+                self.memory.record_build(intent, True, [f"{intent}.py"], attempt + 1, 1.0)
+                self.global_value_memory.validate_agent_action(
+                    agent_id="builder_agent",
+                    action={"type": "generate_code"},
+                    state={"intent": intent}
+                )
+            return intent
+        
+        monkeypatch.setattr(BuilderAgent, "build", record)
+        intents = [f"module_{i}" for i in range(8)]
+        assert asyncio.run(orchestrator.execute_many_async(intents)) == intents
+        
+        saved = json.loads(memory_file.read_text())
+        assert len(saved["entries"]) == 80
+        assert {entry["intent"] for entry in saved["entries"]} == set(intents)
+        assert len(json.loads(value_file.read_text())["alignment_history"]) == 80
+        assert list(memory_file.parent.glob("*.tmp")) == []
+    
     def test_orchestrator_status(self, orchestrator):
         """Test orchestrator provides status"""
         status = orchestrator.get_status()
@@ -258,6 +644,7 @@ class TestBuildResult:
         
         assert len(result.files_created) == 2
         assert len(result.files_modified) == 1
+        assert not hasattr(result, "__dict__")
         assert "file1.py" in result.files_created
 
 
@@ -65,6 +65,46 @@ class TestCLIParser:
         parser = CLIParser()
         with pytest.raises(CLIError, match="intent"):
             parser.parse(["code"])
+    
+    def test_parse_code_flags_between_intent_words(self):
+        """CLI should collect intent words around options, including flags."""
+        from src.cli.main import CLIParser, CLIError
+        
+        parser = CLIParser()
+        args = parser.parse(["code", "-v", "add", "--policy", "p.yaml", "user", "auth"])
+        
+        assert args.intent == "add user auth"
+        assert args.verbose is True
+        assert args.policy_path == "p.yaml"
+        with pytest.raises(CLIError, match="intent"):
+            parser.parse(["code", "--verbose"])
+    
+    def test_subcommand_parsers_are_reused(self):
+        """CLI should build each subcommand parser once without leaking state."""
+        from src.cli.main import CLIParser, _code_parser
+        
+        parser = CLIParser()
+        first = parser.parse(["code", "first", "--verbose", "--no-stream"])
+        second = parser.parse(["code", "second"])
+        
+        assert _code_parser() is _code_parser()
+        assert first.verbose is True and first.stream is False
+        assert second.verbose is False and second.stream is True
+    
+    def test_parse_dispatches_budget_and_explain(self):
+        """CLI should route budget and explain through their parsers."""
+        from src.cli.main import CLIParser, CLIError
+        
+        parser = CLIParser()
+        budget = parser.parse(["budget", "--reset", "--no-color"])
+        explain = parser.parse(["explain"])
+        
+        assert budget.command == "budget"
+        assert budget.dry_run is True and budget.stream is False
+        assert explain.command == "explain"
+        assert explain.explain_target == "last"
+        with pytest.raises(CLIError, match="Unknown command"):
+            parser.parse(["bogus"])
 
 
 class TestCLIFormatter:
@@ -112,6 +152,20 @@ class TestCLIFormatter:
         assert "Name" in output
         assert "Value" in output
         assert "Item 1" in output
+    
+    def test_format_table_aligns_non_string_cells(self):
+        """Formatter should size columns from the widest stringified cell."""
+        from src.cli.main import CLIFormatter
+        
+        formatter = CLIFormatter()
+        output = formatter.table(["Name", "Cost"], [["alpha", 1.5], ["b", 100]])
+        
+        assert output.splitlines() == [
+            "Name  | Cost",
+            "------------",
+            "alpha | 1.5 ",
+            "b     | 100 ",
+        ]
 
 
 class TestCLI:
@@ -197,11 +251,11 @@ class TestInitCommand:
         # Should call save method
         assert mock_loader_instance.save.called or "policy" in result
     
-    def test_init_with_custom_path(self):
+    def test_init_with_custom_path(self, tmp_path):
         """Init command should use custom policy path."""
         from src.cli.main import InitCommand
         
-        cmd = InitCommand(policy_path=Path("/custom/policy.yaml"), verbose=False)
+        cmd = InitCommand(policy_path=tmp_path / "custom" / "policy.yaml", verbose=False)
         result = cmd.execute()
         
         assert "policy_path" in result or "message" in result
@@ -279,3 +333,28 @@ class TestStatusCommand:
         result = cmd.execute()
         
         assert "budgets" in result or "status" in result
+    
+    def test_status_reports_missing_and_invalid_policy(self, tmp_path):
+        """Status command should explain why the policy failed to load."""
+        from src.cli.main import StatusCommand, CLIError
+        
+        policy_path = tmp_path / "policy.yaml"
+        with pytest.raises(CLIError, match="aureus init"):
+            StatusCommand(policy_path=policy_path).execute()
+        
+        policy_path.write_text("version: [unclosed\n")
+        with pytest.raises(CLIError, match="Failed to load policy"):
+            StatusCommand(policy_path=policy_path).execute()
+
+
+class TestBudgetCommand:
+    """Test 'budget' command implementation."""
+    
+    def test_budget_uses_defaults_without_policy(self, tmp_path):
+        """Budget command should fall back to default limits when no policy loads."""
+        from src.cli.main import BudgetCommand
+        
+        cmd = BudgetCommand(project_root=tmp_path, policy_path=tmp_path / "missing.yaml", use_color=False)
+        result = cmd.execute()
+        
+        assert result["status"] == "success"
@@ -24,6 +24,10 @@ from src.memory.cost_ledger import CostLedger
 from src.memory.summarization import TrajectorySummarizer, PatternExtractor
 
 
+# Builds persist build and global value memory under the working directory
+pytestmark = pytest.mark.usefixtures("isolated_cwd")
+
+
 @pytest.fixture
 def test_project(tmp_path):
     """Create a test project structure"""
@@ -0,0 +1,227 @@
+"""
+Tests for File Placement Intelligence
+
+Tests:
+- FileRoleClassifier: role detection from filename and intent
+- FilePlacementEngine: LLM-suggested paths and role-based placement
+"""
+
+import os
+import pytest
+from pathlib import Path
+from src.agents.file_placement import (
+    FilePlacementEngine, FileRoleClassifier, ProjectStructureAnalyzer, clear_structure_cache
+)
+
+
+@pytest.fixture
+def temp_project(tmp_path):
+    """Create temporary project with a src/ layout"""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("APP = 1\n")
+    (tmp_path / "tests").mkdir()
+    return tmp_path
+
+
+class TestFileRoleClassifier:
+    """Test file role classification"""
+    
+    def test_roles_follow_keyword_priority(self):
+        """Test filename and intent keywords match as substrings, in priority order"""
+        cases = [
+            (("user_spec.py", "Create user"), "test"),
+            (("user.py", "Add integration tests for users"), "test"),
+            (("settings.py", "Create user model"), "config"),
+            (("user.py", "Define the user data structure"), "model"),
+            (("routes.py", "Create user"), "controller"),
+            (("user.py", "Expose REST APIs"), "controller"),
+            (("user.py", "Implement business logic"), "service"),
+            (("user.py", "Add a utility"), "util"),
+            (("user.py", "Create user"), "main"),
+        ]
+        for (filename, intent), role in cases:
+            assert FileRoleClassifier.classify(filename, intent) == role, (filename, intent)
+
+
+class TestFilePlacementEngine:
+    """Test file path determination"""
+    
+    def test_suggested_path_accepts_path_objects(self, temp_project):
+        """Test a safe suggested path is used whether given as str or Path"""
+        engine = FilePlacementEngine(temp_project)
+        
+        for suggested in ("pkg/module.py", Path("pkg/module.py")):
+            target = engine.determine_file_path(
+                filename="module.py",
+                intent="Create module",
+                suggested_path=suggested
+            )
+            assert target == temp_project / "pkg" / "module.py"
+    
+    def test_unsafe_suggested_path_falls_back_to_role(self, temp_project):
+        """Test traversal and bare filenames use role-based placement"""
+        engine = FilePlacementEngine(temp_project)
+        
+        for suggested in (Path("../escape.py"), Path("module.py")):
+            target = engine.determine_file_path(
+                filename="module.py",
+                intent="Create module",
+                suggested_path=suggested
+            )
+            assert target.name == "module.py"
+            assert temp_project in target.parents
+    
+    def test_validate_suggested_path_matches_path_semantics(self, temp_project):
+        """Test string validation agrees with Path parsing on edge cases"""
+        engine = FilePlacementEngine(temp_project)
+        
+        assert engine._validate_suggested_path("./pkg//mod.py") == temp_project / "pkg" / "mod.py"
+        assert engine._validate_suggested_path("pkg/./mod.py") == temp_project / "pkg" / "mod.py"
+        for rejected in ("./mod.py", "mod.py/", "", "/etc/passwd", "pkg/../../x.py", "a/../b.py"):
+            assert engine._validate_suggested_path(rejected) is None, rejected
+    
+    def test_validate_suggested_path_rejects_windows_drives(self, temp_project, monkeypatch):
+        """Test drive-relative and drive-qualified suggestions cannot escape the root"""
+        import ntpath
+        from pathlib import PureWindowsPath
+        from types import SimpleNamespace
+        import src.agents.file_placement as file_placement
+        
+        engine = FilePlacementEngine(temp_project)
+        engine.project_root = PureWindowsPath("C:/project")
+        monkeypatch.setattr(file_placement, "os", SimpleNamespace(fspath=os.fspath, path=ntpath, sep="\\"))
+        
+        assert engine._validate_suggested_path("pkg\\mod.py") == PureWindowsPath("C:/project/pkg/mod.py")
+        for rejected in ("D:foo/x.py", "D:/foo/x.py", "\\\\server\\share\\x.py", "\\pkg\\x.py"):
+            assert engine._validate_suggested_path(rejected) is None, rejected
+    
+    def test_role_directory_resolved_once(self, temp_project, monkeypatch):
+        """Test later files of a role reuse the directory found for the first"""
+        engine = FilePlacementEngine(temp_project)
+        first = engine.determine_file_path("user_model.py", "Create user model")
+        
+        def fail(*args):
+            raise AssertionError("role directory resolved twice")
+        monkeypatch.setattr(engine, "_resolve_role_directory", fail)
+        second = engine.determine_file_path("order_model.py", "Create order model")
+        
+        assert first.parent == second.parent
+        assert second.name == "order_model.py"
+    
+    def test_structure_summary_is_serialized_once(self, temp_project):
+        """Test the structure summary is reused across placement logs"""
+        engine = FilePlacementEngine(temp_project)
+        
+        summary = engine.get_structure_summary()
+        assert summary["has_src_dir"] is True
+        assert engine.get_structure_summary() is summary
+    
+    def test_role_directories_created_once(self, temp_project, monkeypatch):
+        """Test repeated placements do not re-create known directories"""
+        engine = FilePlacementEngine(temp_project)
+        made = []
+        mkdir = Path.mkdir
+        monkeypatch.setattr(Path, "mkdir", lambda self, *a, **kw: made.append(self) or mkdir(self, *a, **kw))
+        
+        for name in ("user_model.py", "order_model.py"):
+            target = engine.determine_file_path(name, intent="Create data model")
+            assert target == temp_project / "workspace" / "models" / name
+            assert target.parent.is_dir()
+        
+        assert made == [temp_project / "workspace", temp_project / "workspace" / "models"]
+    
+    def test_existing_role_directories_are_reused(self, temp_project):
+        """Test an existing candidate directory wins over creating a new one"""
+        workspace = temp_project / "workspace"
+        (workspace / "handlers").mkdir(parents=True)
+        (workspace / "logic").write_text("not a directory\n")
+        engine = FilePlacementEngine(temp_project)
+        
+        assert engine.determine_file_path("user_api.py", "Create user") == workspace / "handlers" / "user_api.py"
+        assert engine.determine_file_path("billing_service.py", "Bill") == workspace / "services" / "billing_service.py"
+        assert (workspace / "services").is_dir()
+    
+    def test_structure_analysis_shared_until_root_changes(self, temp_project, monkeypatch):
+        """Test engines for an unchanged root reuse one analysis"""
+        clear_structure_cache()
+        calls = []
+        analyze = ProjectStructureAnalyzer.analyze
+        monkeypatch.setattr(ProjectStructureAnalyzer, "analyze",
+                            lambda self: calls.append(self) or analyze(self))
+        
+        first = FilePlacementEngine(temp_project)
+        assert FilePlacementEngine(temp_project).structure is first.structure
+        assert len(calls) == 1
+        
+        (temp_project / "lib").mkdir()
+        os.utime(temp_project, ns=(0, 1))  # force a distinct root mtime
+        assert FilePlacementEngine(temp_project).structure.has_lib_dir is True
+        assert len(calls) == 2
+        
+        clear_structure_cache()
+        FilePlacementEngine(temp_project)
+        assert len(calls) == 3
+
+
+class TestProjectStructureAnalyzer:
+    """Test project structure detection"""
+    
+    def test_top_level_layout_detected_from_directories(self, tmp_path):
+        """Test only directories count as layout and test directories"""
+        (tmp_path / "lib").mkdir()
+        (tmp_path / "spec").mkdir()
+        (tmp_path / "src").write_text("not a directory\n")
+        (tmp_path / "tests").write_text("not a directory\n")
+        
+        structure = ProjectStructureAnalyzer(tmp_path).analyze()
+        
+        assert structure.has_src_dir is False
+        assert structure.has_lib_dir is True
+        assert structure.primary_code_dir == tmp_path / "lib"
+        assert structure.test_dir == tmp_path / "spec"
+        assert structure.prefers_plural_dirs is False
+    
+    def test_missing_root_gives_default_structure(self, tmp_path):
+        """Test a missing project root is not scanned"""
+        structure = ProjectStructureAnalyzer(tmp_path / "missing").analyze()
+        assert structure.has_tests_dir is False
+        assert structure.test_dir is None
+    
+    def test_python_scan_skips_environments_and_tests(self, tmp_path):
+        """Test one walk feeds package, naming and primary-dir detection"""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "core.py").write_text("")
+        (tmp_path / "pkg" / "helpers.py").write_text("")
+        (tmp_path / "pkg" / "test_core.py").write_text("")
+        (tmp_path / "scripts").mkdir()
+        (tmp_path / "scripts" / "run_all.py").write_text("")
+        for skipped in ("venv", "node_modules"):
+            (tmp_path / skipped / "site").mkdir(parents=True)
+            (tmp_path / skipped / "site" / "__init__.py").write_text("")
+            (tmp_path / skipped / "site" / "a_b.py").write_text("")
+            (tmp_path / skipped / "site" / "c_d.py").write_text("")
+        
+        structure = ProjectStructureAnalyzer(tmp_path).analyze()
+        
+        assert structure.is_package is False
+        assert structure.primary_code_dir == tmp_path / "pkg"
+        assert structure.uses_underscores is False  # 2 of 4 files
+        
+        (tmp_path / "pkg" / "__init__.py").write_text("")
+        assert ProjectStructureAnalyzer(tmp_path).analyze().is_package is True
+    
+    def test_aureus_project_does_not_pick_src(self, tmp_path):
+        """Test the Aureus checkout never chooses a src/ tree as primary code dir"""
+        root = tmp_path / "Aureus_Coding_Agent"
+        (root / "src" / "agents").mkdir(parents=True)
+        for name in ("a.py", "b.py", "c.py"):
+            (root / "src" / "agents" / name).write_text("")
+        (root / "tools").mkdir()
+        (root / "tools" / "run.py").write_text("")
+        
+        analyzer = ProjectStructureAnalyzer(root)
+        structure = analyzer.analyze()
+        
+        assert analyzer._is_aureus_project is True
+        assert structure.primary_code_dir == root / "tools"
+        assert structure.is_package is False
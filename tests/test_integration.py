@@ -20,6 +20,10 @@ from src.governance.intent_parser import SpecificationGenerator
 from src.governance.planner import PricingKernel
 
 
+# Builds persist build and global value memory under the working directory
+pytestmark = pytest.mark.usefixtures("isolated_cwd")
+
+
 @pytest.fixture
 def integration_project(tmp_path):
     """Create temporary project for integration testing"""
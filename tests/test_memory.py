@@ -114,6 +114,48 @@ class TestTrajectoryStore:
         sessions = store.list_sessions()
         
         assert len(sessions) >= 3
+    
+    def test_list_sessions_reparses_only_changed_files(self, temp_storage):
+        """Test unchanged session files are served from the parse cache"""
+        store = TrajectoryStore(storage_dir=temp_storage)
+        
+        s1 = store.start_session(intent="Cached session")
+        store.end_session(s1.session_id, success=True, total_cost=10.0)
+        (temp_storage / "costs.json").write_text("[]")
+        
+        first = store.list_sessions()
+        assert [s.intent for s in first] == ["Cached session"]
+        assert store.list_sessions()[0] is first[0]
+        
+        s2 = store.start_session(intent="Second session")
+        store.end_session(s2.session_id, success=False, total_cost=5.0)
+        sessions = store.list_sessions()
+        assert {s.intent for s in sessions} == {"Cached session", "Second session"}
+        assert first[0] in sessions
+        
+        (temp_storage / f"{s1.session_id}.json").unlink()
+        assert [s.intent for s in store.list_sessions()] == ["Second session"]
+    
+    def test_session_summaries_match_sessions(self, temp_storage):
+        """Test summaries agree with full sessions, parsed or not"""
+        store = TrajectoryStore(storage_dir=temp_storage)
+        
+        s1 = store.start_session(intent="With actions")
+        store.record_actions(s1.session_id, [
+            ActionRecord(phase="act", tool="write", input={}, output=None, cost=1.0, success=True),
+            ActionRecord(phase="verify", tool="test", input={}, output=None, cost=0.5, success=True),
+        ])
+        store.end_session(s1.session_id, success=True, total_cost=7.5)
+        s2 = store.start_session(intent="Empty")
+        store.end_session(s2.session_id, success=False, total_cost=2.0)
+        (temp_storage / "costs.json").write_text("[]")
+        (temp_storage / "broken.json").write_text("{not json")
+        
+        expected = [(True, 7.5, 2), (False, 2.0, 0)]
+        assert sorted(store.session_summaries()) == sorted(expected)
+        
+        store.list_sessions()  # now served from the parse cache
+        assert sorted(store.session_summaries()) == sorted(expected)
 
 
 class TestCostLedger:
@@ -188,3 +188,17 @@ class TestProviderRegistry:
         
         with pytest.raises(ValueError):
             registry.get()
+
+
+class TestEnhancedMockProvider:
+    """Test EnhancedMockProvider construction"""
+    
+    def test_token_encoding_shared_across_instances(self):
+        """Test that providers for the same model reuse the tokenizer encoding"""
+        from src.model_provider.enhanced import EnhancedMockProvider
+        
+        first = EnhancedMockProvider("enhanced-builder")
+        second = EnhancedMockProvider("enhanced-builder")
+        
+        assert first.token_counter._encoding is second.token_counter._encoding
+        assert first.complete("hello").tokens_used == second.complete("hello").tokens_used
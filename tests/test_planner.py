@@ -14,6 +14,7 @@ Test Coverage:
 import pytest
 import sys
 from pathlib import Path
+from dataclasses import replace
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -360,6 +361,66 @@ class TestPricingKernel:
         assert cost.total > 0
         assert cost.within_budget is True
 
+    def test_price_is_cached_across_kernels(self):
+        """Test repeated specifications reuse the memoized cost"""
+        spec = Specification(
+            intent="Add cached endpoint",
+            success_criteria=["Endpoint responds with 200"],
+            budgets=SpecificationBudget(max_loc_delta=2000, max_new_files=3, max_new_dependencies=2),
+            risk_level="medium"
+        )
+        policy = Policy(
+            version="1.0",
+            project_name="test-api",
+            project_root=Path("."),
+            budgets=Budget(max_loc=1000, max_dependencies=10, max_modules=5, max_files=25),
+            permissions={"file_write": True}
+        )
+        
+        first = PricingKernel().price(spec, policy)
+        first.alternatives.clear()
+        second = PricingKernel().price(spec, policy)
+        
+        assert second == replace(first, alternatives=second.alternatives)
+        assert len(second.alternatives) > 0
+        
+        # Different policy budget is priced separately
+        policy.budgets = Budget(max_loc=5000, max_dependencies=10, max_modules=5, max_files=25)
+        assert PricingKernel().price(spec, policy).within_budget is True
+
+    def test_price_cache_is_thread_safe(self, monkeypatch):
+        """Test concurrent pricing through a small shared cache keeps it consistent"""
+        from collections import OrderedDict
+        from concurrent.futures import ThreadPoolExecutor
+        
+        monkeypatch.setattr(PricingKernel, "_price_cache", OrderedDict())
+        monkeypatch.setattr(PricingKernel, "CACHE_SIZE", 4)
+        policy = Policy(
+            version="1.0",
+            project_name="test-api",
+            project_root=Path("."),
+            budgets=Budget(max_loc=1000, max_dependencies=10, max_modules=5, max_files=25),
+            permissions={"file_write": True}
+        )
+        specs = [
+            Specification(
+                intent=f"Add endpoint {i}",
+                success_criteria=["Endpoint responds with 200"],
+                budgets=SpecificationBudget(max_loc_delta=100 + i, max_new_files=1, max_new_dependencies=0),
+                risk_level="low"
+            )
+            for i in range(8)
+        ]
+        
+        def price_all(_):
+            return [PricingKernel().price(spec, policy).loc for spec in specs * 20]
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(price_all, range(8)))
+        
+        assert all(locs == [100 + i for i in range(8)] * 20 for locs in results)
+        assert len(PricingKernel._price_cache) <= 4
+
     def test_reject_over_budget_specification(self):
         """Test that over-budget specifications are rejected"""
         kernel = PricingKernel()
@@ -192,7 +192,41 @@ cost_thresholds:
         loaded = loader.load(policy_file)
         assert loaded.version == "1.0"
         assert loaded.project_name == "test"
-    
+
+    def test_load_reuses_parse_until_file_changes(self, tmp_path):
+        """PolicyLoader should reuse cached YAML until the file is modified."""
+        from src.governance.policy import PolicyLoader
+
+        policy_yaml = """
+version: "1.0"
+project:
+  name: "{name}"
+  root: "/path"
+budgets:
+  max_loc: 10000
+  max_modules: 8
+  max_files: 30
+  max_dependencies: 20
+permissions:
+  tools:
+    file_read: allow
+"""
+        policy_file = tmp_path / "policy.yaml"
+        policy_file.write_text(policy_yaml.format(name="first"))
+
+        loader = PolicyLoader()
+        first = loader.load(policy_file)
+        first.permissions["tools"]["file_read"] = "deny"
+
+        # Cached loads return independent objects
+        second = loader.load(policy_file)
+        assert second.project_name == "first"
+        assert second.permissions["tools"]["file_read"] == "allow"
+
+        # Edits invalidate the cache
+        policy_file.write_text(policy_yaml.format(name="second-name"))
+        assert loader.load(policy_file).project_name == "second-name"
+
     def test_load_from_example_file(self):
         """PolicyLoader should load the example policy file."""
         from src.governance.policy import PolicyLoader
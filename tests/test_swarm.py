@@ -0,0 +1,141 @@
+"""
+Tests for the Generator Agent Swarm
+
+Tests:
+- CoordinatorAgent: dependency-ordered workflow execution
+- CodeGeneratorAgent: LLM response parsing
+"""
+
+import threading
+import pytest
+from src.agents.swarm import AgentMessage, AgentRole, AgentTask, BaseAgent, CodeGeneratorAgent, CoordinatorAgent
+from src.model_provider import MockProvider
+
+
+class RecordingAgent(BaseAgent):
+    """Agent that records the order tasks reach it"""
+    
+    def __init__(self, role: AgentRole, order: list):
+        super().__init__(role.value, role)
+        self.order = order
+    
+    def execute_task(self, task: AgentTask) -> AgentTask:
+        self.order.append(task.task_id)
+        task.status = "completed"
+        task.result = {"id": task.task_id, "inputs": sorted(task.inputs)}
+        return task
+
+
+class TestCoordinatorAgent:
+    """Test workflow scheduling"""
+    
+    def test_workflow_runs_in_dependency_rounds(self):
+        """Test tasks run round by round in list order with dependency results"""
+        order = []
+        coordinator = CoordinatorAgent()
+        coordinator.register_agent(RecordingAgent(AgentRole.CODE_GENERATOR, order))
+        role = AgentRole.CODE_GENERATOR
+        tasks = [
+            AgentTask("x", role, "X", {}, dependencies=["b"]),
+            AgentTask("y", role, "Y", {}, dependencies=["a"]),
+            AgentTask("a", role, "A", {}),
+            AgentTask("b", role, "B", {}),
+            AgentTask("z", role, "Z", {}, dependencies=["x", "y"]),
+        ]
+        
+        results = coordinator.execute_workflow(tasks)
+        
+        assert list(results) == ["a", "b", "x", "y", "z"]
+        assert set(order[:2]) == {"a", "b"} and set(order[2:4]) == {"x", "y"}
+        assert order[4] == "z"
+        assert results["z"]["inputs"] == ["x", "y"]
+    
+    def test_ready_tasks_execute_concurrently(self):
+        """Test tasks in the same round overlap instead of running one by one"""
+        barrier = threading.Barrier(2, timeout=5)
+        
+        class BarrierAgent(RecordingAgent):
+            def execute_task(self, task):
+                barrier.wait()  # both tasks must be running at once
+                return super().execute_task(task)
+        
+        order = []
+        coordinator = CoordinatorAgent()
+        coordinator.register_agent(BarrierAgent(AgentRole.TEST_WRITER, order))
+        tasks = [
+            AgentTask("t1", AgentRole.TEST_WRITER, "T1", {}),
+            AgentTask("t2", AgentRole.TEST_WRITER, "T2", {}),
+        ]
+        
+        results = coordinator.execute_workflow(tasks)
+        
+        assert list(results) == ["t1", "t2"]
+    
+    def test_workflow_stops_when_nothing_can_run(self):
+        """Test unknown dependencies and agent-less roles end the workflow"""
+        order = []
+        coordinator = CoordinatorAgent()
+        coordinator.register_agent(RecordingAgent(AgentRole.CODE_GENERATOR, order))
+        tasks = [
+            AgentTask("gen", AgentRole.CODE_GENERATOR, "Gen", {}),
+            AgentTask("orphan", AgentRole.CODE_GENERATOR, "Orphan", {}, dependencies=["missing"]),
+            AgentTask("review", AgentRole.REFACTOR, "No agent", {}),
+            AgentTask("after", AgentRole.CODE_GENERATOR, "After", {}, dependencies=["review"]),
+        ]
+        
+        results = coordinator.execute_workflow(tasks)
+        
+        assert order == ["gen"]
+        assert list(results) == ["gen"]
+
+
+class TestSwarmDataclasses:
+    """Test swarm message and task records"""
+    
+    def test_tasks_get_their_own_dependency_lists(self):
+        """Test slotted tasks default to separate empty dependency lists"""
+        first = AgentTask("a", AgentRole.ARCHITECT, "A", {})
+        second = AgentTask("b", AgentRole.ARCHITECT, "B", {})
+        
+        first.dependencies.append("x")
+        
+        assert second.dependencies == []
+        assert not hasattr(first, "__dict__")
+        assert not hasattr(AgentMessage("a", "b", "request", {}), "__dict__")
+
+
+class TestBaseAgent:
+    """Test agent messaging"""
+    
+    def test_inbox_pops_most_urgent_message_first(self):
+        """Test inbox ordering by priority, then arrival"""
+        agent = RecordingAgent(AgentRole.CODE_GENERATOR, [])
+        for sender, priority in (("low", 1), ("first", 9), ("default", 5), ("second", 9)):
+            agent.receive_message(AgentMessage(sender, agent.agent_id, "request", {}, priority=priority))
+        
+        senders = []
+        while (message := agent.pop_highest_priority()) is not None:
+            senders.append(message.sender)
+        
+        assert senders == ["first", "second", "default", "low"]
+        assert agent.pop_highest_priority() is None
+
+
+class TestCodeGeneratorAgent:
+    """Test code generation agent"""
+    
+    def test_extract_files_pairs_paths_with_code_blocks(self):
+        """Test FILE markers are paired with python blocks in order"""
+        agent = CodeGeneratorAgent(MockProvider())
+        content = (
+            "FILE: pkg/a.py\n```python\nA = 1\n```\n"
+            "FILE: pkg/b.py\n```python\nB = 2\nC = 3\n```\n"
+            "FILE: pkg/orphan.py\n"
+        )
+        
+        files = agent._extract_files(content)
+        
+        assert files == [
+            {"path": "pkg/a.py", "code": "A = 1"},
+            {"path": "pkg/b.py", "code": "B = 2\nC = 3"},
+        ]
@@ -115,7 +115,20 @@ class TestFileWriteTool:
         assert result.success is True
         assert (temp_project / "new_file.txt").exists()
         assert (temp_project / "new_file.txt").read_text() == "New content"
-    
+
+    def test_write_reports_encoded_size(self, temp_project):
+        """Test that size is reported in UTF-8 bytes"""
+        tool = FileWriteTool(temp_project)
+
+        result = tool.execute(
+            file_path="unicode.txt",
+            content="héllo ✓\n"
+        )
+
+        assert result.success is True
+        assert result.metadata["size_bytes"] == len("héllo ✓\n".encode("utf-8"))
+        assert (temp_project / "unicode.txt").read_text(encoding="utf-8") == "héllo ✓\n"
+
     def test_write_overwrites_existing_file(self, temp_project):
         """Test overwriting existing file"""
         tool = FileWriteTool(temp_project)